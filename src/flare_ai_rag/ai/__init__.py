@@ -1,4 +1,6 @@
 from .base import AsyncBaseClient, BaseClient
+from .embedding_cache import EmbeddingCache, content_hash
+from .embedding_engine import BatchEmbeddingEngine, EmbeddingItem, EmbeddingStats
 from .gemini import EmbeddingTaskType, GeminiEmbedding, GeminiProvider
 from .model import Model
 from .openrouter import OpenRouterClient
@@ -6,9 +8,14 @@ from .openrouter import OpenRouterClient
 __all__ = [
     "AsyncBaseClient",
     "BaseClient",
+    "BatchEmbeddingEngine",
+    "EmbeddingCache",
+    "EmbeddingItem",
+    "EmbeddingStats",
     "EmbeddingTaskType",
     "GeminiEmbedding",
     "GeminiProvider",
     "Model",
     "OpenRouterClient",
+    "content_hash",
 ]
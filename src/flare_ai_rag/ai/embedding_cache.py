@@ -0,0 +1,248 @@
+"""
+Embedding Cache Module
+
+This module implements a content-addressed, on-disk cache for embedding vectors.
+Vectors live in a single float32 array file that is memory-mapped and addressed by
+slot offset, while a small JSON index maps content hashes to slots in
+least-recently-used order so the cache can be bounded in size. A parallel file
+records which key each slot holds, so index entries whose slot has since been
+reused are detected and dropped on load.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+VECTORS_FILE = "vectors.f32"
+INDEX_FILE = "index.json"
+KEYS_FILE = "keys.bin"
+KEY_DIGEST_SIZE = 32
+
+
+def content_hash(
+    embedding_model: str, task_type: Any, title: str | None, text: str
+) -> str:
+    """
+    Compute the cache key of a text to embed.
+
+    Args:
+        embedding_model (str): The embedding model identifier.
+        task_type (Any): The embedding task type.
+        title (str | None): Optional document title.
+        text (str): The text to be embedded.
+
+    Returns:
+        str: Hex digest identifying the (model, task type, title, text) tuple.
+    """
+    task_name = getattr(task_type, "name", str(task_type))
+    key = json.dumps([embedding_model, task_name, title, text], ensure_ascii=False)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _key_digest(key: str) -> np.ndarray:
+    """Fixed-size digest of a cache key, stored next to its vector."""
+    return np.frombuffer(hashlib.sha256(key.encode("utf-8")).digest(), dtype=np.uint8)
+
+
+class EmbeddingCache:
+    """
+    Size-bounded persistent cache of embedding vectors.
+
+    Attributes:
+        cache_dir (Path): Directory holding the vector and index files.
+        vector_size (int): Dimension of the cached vectors.
+        max_entries (int): Maximum number of vectors kept before evicting.
+        hits (int): Number of successful lookups.
+        misses (int): Number of failed lookups.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        vector_size: int,
+        max_entries: int = 100_000,
+        flush_every: int = 256,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.vector_size = vector_size
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._slots: OrderedDict[str, int] = OrderedDict()
+        self._free: list[int] = []
+        self._next_slot = 0
+        self._pending = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._vectors, self._keys = self._load()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get(self, key: str) -> list[float] | None:
+        """Return the cached vector for `key`, or None on a miss."""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: Sequence[str]) -> list[list[float] | None]:
+        """Return cached vectors for several keys, None for each miss."""
+        results: list[list[float] | None] = []
+        with self._lock:
+            for key in keys:
+                slot = self._slots.get(key)
+                if slot is None:
+                    self.misses += 1
+                    results.append(None)
+                    continue
+                self._slots.move_to_end(key)
+                self.hits += 1
+                results.append(self._vectors[slot].tolist())
+        return results
+
+    def put(self, key: str, vector: Sequence[float]) -> None:
+        """Store a vector under `key`."""
+        self.put_many([key], [vector])
+
+    def put_many(self, keys: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Store several vectors, evicting the least recently used if full."""
+        with self._lock:
+            for key, vector in zip(keys, vectors, strict=True):
+                if len(vector) != self.vector_size:
+                    msg = (
+                        f"Expected a vector of size {self.vector_size}, "
+                        f"got {len(vector)}."
+                    )
+                    raise ValueError(msg)
+                slot = self._slots.get(key)
+                if slot is None:
+                    slot = self._allocate_slot()
+                    self._slots[key] = slot
+                else:
+                    self._slots.move_to_end(key)
+                self._vectors[slot] = vector
+                self._keys[slot] = _key_digest(key)
+                self._pending += 1
+            if self._pending >= self.flush_every:
+                self._flush()
+
+    def flush(self) -> None:
+        """Persist the vectors and the index to disk."""
+        with self._lock:
+            self._flush()
+
+    def _allocate_slot(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if len(self._slots) >= self.max_entries:
+            _, slot = self._slots.popitem(last=False)
+            return slot
+        slot = self._next_slot
+        self._next_slot += 1
+        if slot >= self._vectors.shape[0]:
+            self._resize(min(self.max_entries, max(1024, 2 * self._vectors.shape[0])))
+        return slot
+
+    def _resize(self, capacity: int) -> None:
+        """Grow the memory-mapped vector and key files to hold `capacity` vectors."""
+        self._vectors.flush()
+        self._keys.flush()
+        del self._vectors, self._keys
+        vectors_path = self.cache_dir / VECTORS_FILE
+        keys_path = self.cache_dir / KEYS_FILE
+        with vectors_path.open("r+b") as f:
+            f.truncate(capacity * self.vector_size * np.dtype(np.float32).itemsize)
+        with keys_path.open("r+b") as f:
+            f.truncate(capacity * KEY_DIGEST_SIZE)
+        self._vectors, self._keys = self._open_files(capacity)
+
+    def _open_files(self, capacity: int) -> tuple[np.memmap, np.memmap]:
+        """Memory-map the vector and key files, sized for `capacity` vectors."""
+        vectors = np.memmap(
+            self.cache_dir / VECTORS_FILE,
+            dtype=np.float32,
+            mode="r+",
+            shape=(capacity, self.vector_size),
+        )
+        keys = np.memmap(
+            self.cache_dir / KEYS_FILE,
+            dtype=np.uint8,
+            mode="r+",
+            shape=(capacity, KEY_DIGEST_SIZE),
+        )
+        return vectors, keys
+
+    def _load(self) -> tuple[np.memmap, np.memmap]:
+        """Open the cache files and restore the index entries that are valid."""
+        vectors_path = self.cache_dir / VECTORS_FILE
+        keys_path = self.cache_dir / KEYS_FILE
+        index_path = self.cache_dir / INDEX_FILE
+        row_bytes = self.vector_size * np.dtype(np.float32).itemsize
+
+        index: dict[str, Any] = {}
+        if index_path.exists() and vectors_path.exists() and keys_path.exists():
+            try:
+                index = json.loads(index_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                logger.warning("Embedding cache index is unreadable, resetting.")
+        if index.get("vector_size") != self.vector_size:
+            index = {}
+
+        capacity = vectors_path.stat().st_size // row_bytes if index else 0
+        if index and keys_path.stat().st_size != capacity * KEY_DIGEST_SIZE:
+            capacity = 0
+        if capacity == 0:
+            capacity = min(self.max_entries, 1024)
+            with vectors_path.open("wb") as f:
+                f.truncate(capacity * row_bytes)
+            with keys_path.open("wb") as f:
+                f.truncate(capacity * KEY_DIGEST_SIZE)
+            index = {}
+        vectors, keys = self._open_files(capacity)
+
+        used: set[int] = set()
+        stale = 0
+        for key, slot in index.get("entries", []):
+            if slot >= min(capacity, self.max_entries) or slot in used:
+                continue
+            # The slot may have been reused for another key after the last flush.
+            if not np.array_equal(keys[slot], _key_digest(key)):
+                stale += 1
+                continue
+            self._slots[key] = slot
+            used.add(slot)
+        self._next_slot = max(used) + 1 if used else 0
+        self._free = sorted(set(range(self._next_slot)) - used, reverse=True)
+        logger.info(
+            "Embedding cache loaded.",
+            path=str(self.cache_dir),
+            entries=len(self),
+            stale=stale,
+        )
+        return vectors, keys
+
+    def _flush(self) -> None:
+        self._vectors.flush()
+        self._keys.flush()
+        index = {
+            "vector_size": self.vector_size,
+            "entries": [[key, slot] for key, slot in self._slots.items()],
+        }
+        tmp_path = self.cache_dir / f"{INDEX_FILE}.tmp"
+        tmp_path.write_text(json.dumps(index), encoding="utf-8")
+        tmp_path.replace(self.cache_dir / INDEX_FILE)
+        self._pending = 0
@@ -0,0 +1,265 @@
+"""
+Batch Embedding Engine Module
+
+This module provides a batching front-end for `GeminiEmbedding`. Texts already in
+the client's embedding cache are served from it, the rest are grouped into batch
+requests, a bounded number of requests are kept in flight at once, and requests
+rejected because of rate limiting are retried with exponential backoff. Input can
+be consumed lazily, so long streams are embedded with bounded memory.
+"""
+
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import google.api_core.exceptions
+import structlog
+
+from flare_ai_rag.ai.embedding_cache import content_hash
+from flare_ai_rag.ai.gemini import (
+    EMBEDDING_MAX_BATCH_SIZE,
+    EmbeddingTaskType,
+    GeminiEmbedding,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Errors signalling that the request should simply be retried later.
+RETRYABLE_ERRORS = (
+    google.api_core.exceptions.ResourceExhausted,
+    google.api_core.exceptions.TooManyRequests,
+    google.api_core.exceptions.ServiceUnavailable,
+    google.api_core.exceptions.DeadlineExceeded,
+)
+
+
+@dataclass(frozen=True)
+class EmbeddingItem:
+    """A single text to embed, with its optional document title."""
+
+    text: str
+    title: str | None = None
+
+
+@dataclass
+class EmbeddingStats:
+    """Counters describing a batch embedding run."""
+
+    texts: int = 0
+    cached: int = 0
+    failed: int = 0
+    requests: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+
+    @property
+    def texts_per_second(self) -> float:
+        """Throughput of successfully embedded texts."""
+        if self.seconds <= 0:
+            return 0.0
+        return (self.texts - self.failed) / self.seconds
+
+
+@dataclass
+class _PendingBatch[T]:
+    """A batch of records whose cache misses are being embedded."""
+
+    records: list[T]
+    keys: list[str]
+    vectors: list[list[float] | None]
+    missing: list[int]
+    future: Future[list[list[float] | None]] | None
+
+
+class BatchEmbeddingEngine:
+    """
+    Embed many texts with few round trips.
+
+    Attributes:
+        embedding_client (GeminiEmbedding): Client used for the embedding calls.
+        embedding_model (str): Embedding model identifier.
+        task_type (EmbeddingTaskType): Task type sent with every request.
+        batch_size (int): Number of texts per batch request.
+        max_concurrency (int): Maximum number of batch requests in flight.
+        max_retries (int): Retries per batch on rate-limit errors.
+        stats (EmbeddingStats): Counters of the most recent embedding run.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        embedding_client: GeminiEmbedding,
+        embedding_model: str,
+        task_type: EmbeddingTaskType = EmbeddingTaskType.RETRIEVAL_DOCUMENT,
+        batch_size: int = EMBEDDING_MAX_BATCH_SIZE,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        backoff_seconds: float = 1.0,
+    ) -> None:
+        if not 0 < batch_size <= EMBEDDING_MAX_BATCH_SIZE:
+            msg = f"batch_size must be between 1 and {EMBEDDING_MAX_BATCH_SIZE}."
+            raise ValueError(msg)
+        self.embedding_client = embedding_client
+        self.embedding_model = embedding_model
+        self.task_type = task_type
+        self.batch_size = batch_size
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.stats = EmbeddingStats()
+        self._stats_lock = threading.Lock()
+
+    def embed(self, items: Sequence[EmbeddingItem]) -> list[list[float] | None]:
+        """
+        Embed a sequence of texts.
+
+        Args:
+            items (Sequence[EmbeddingItem]): The texts (and titles) to embed.
+
+        Returns:
+            list[list[float] | None]: One vector per item, in input order. Items
+                that could not be embedded are returned as `None`.
+        """
+        return [vector for _, vector in self.embed_stream(items, lambda item: item)]
+
+    def embed_stream[T](
+        self, records: Iterable[T], to_item: Callable[[T], EmbeddingItem]
+    ) -> Iterator[tuple[T, list[float] | None]]:
+        """
+        Lazily embed a stream of records.
+
+        Records are pulled from `records` one batch at a time and at most
+        `max_concurrency` batches are held in memory, so arbitrarily long streams
+        are embedded with bounded memory.
+
+        Args:
+            records (Iterable[T]): The records to embed.
+            to_item (Callable[[T], EmbeddingItem]): Extracts the text (and title)
+                to embed from a record.
+
+        Yields:
+            tuple[T, list[float] | None]: Each record with its vector, in input
+                order. The vector is `None` if the text could not be embedded.
+        """
+        self.stats = EmbeddingStats()
+        start = time.perf_counter()
+        cache = self.embedding_client.cache
+
+        pending: deque[_PendingBatch[T]] = deque()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for batch in itertools.batched(records, self.batch_size):
+                pending.append(self._submit(executor, list(batch), to_item))
+                while len(pending) > self.max_concurrency:
+                    yield from self._collect(pending.popleft())
+            while pending:
+                yield from self._collect(pending.popleft())
+
+        if cache is not None:
+            cache.flush()
+        self.stats.seconds = time.perf_counter() - start
+        logger.info(
+            "Embedding run finished.",
+            texts=self.stats.texts,
+            cached=self.stats.cached,
+            failed=self.stats.failed,
+            requests=self.stats.requests,
+            retries=self.stats.retries,
+            seconds=round(self.stats.seconds, 3),
+            texts_per_second=round(self.stats.texts_per_second, 2),
+        )
+
+    def _submit[T](
+        self,
+        executor: ThreadPoolExecutor,
+        records: list[T],
+        to_item: Callable[[T], EmbeddingItem],
+    ) -> _PendingBatch[T]:
+        """Serve a batch from the cache and schedule a request for the misses."""
+        items = [to_item(record) for record in records]
+        keys = [
+            content_hash(self.embedding_model, self.task_type, item.title, item.text)
+            for item in items
+        ]
+        cache = self.embedding_client.cache
+        vectors: list[list[float] | None] = (
+            cache.get_many(keys) if cache is not None else [None] * len(items)
+        )
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        future = (
+            executor.submit(self._embed_batch, [items[i] for i in missing])
+            if missing
+            else None
+        )
+        return _PendingBatch(records, keys, vectors, missing, future)
+
+    def _collect[T](
+        self, batch: _PendingBatch[T]
+    ) -> Iterator[tuple[T, list[float] | None]]:
+        """Wait for a scheduled batch, cache its vectors and yield the results."""
+        if batch.future is not None:
+            for i, vector in zip(batch.missing, batch.future.result(), strict=True):
+                batch.vectors[i] = vector
+            cache = self.embedding_client.cache
+            if cache is not None:
+                stored = [
+                    (batch.keys[i], vector)
+                    for i in batch.missing
+                    if (vector := batch.vectors[i]) is not None
+                ]
+                cache.put_many(
+                    [key for key, _ in stored], [vector for _, vector in stored]
+                )
+
+        self.stats.texts += len(batch.records)
+        self.stats.cached += len(batch.records) - len(batch.missing)
+        self.stats.failed += sum(vector is None for vector in batch.vectors)
+        yield from zip(batch.records, batch.vectors, strict=True)
+
+    def _embed_batch(self, batch: Sequence[EmbeddingItem]) -> list[list[float] | None]:
+        """Embed one batch, falling back to single requests on invalid input."""
+        try:
+            return list(self._request_with_retry(batch))
+        except google.api_core.exceptions.InvalidArgument:
+            # One oversized text fails the whole batch; isolate it.
+            if len(batch) == 1:
+                logger.warning(
+                    "Skipping text rejected by the embedding API.",
+                    title=batch[0].title,
+                )
+                return [None]
+            return [vector for item in batch for vector in self._embed_batch([item])]
+        except Exception:
+            logger.exception("Error embedding batch.", size=len(batch))
+            return [None] * len(batch)
+
+    def _request_with_retry(self, batch: Sequence[EmbeddingItem]) -> list[list[float]]:
+        """Send a batch request, backing off exponentially on rate limits."""
+        attempt = 0
+        while True:
+            with self._stats_lock:
+                self.stats.requests += 1
+            try:
+                return self.embedding_client.embed_contents(
+                    embedding_model=self.embedding_model,
+                    contents=[item.text for item in batch],
+                    task_type=self.task_type,
+                    titles=[item.title for item in batch],
+                )
+            except RETRYABLE_ERRORS:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_seconds * 2**attempt
+                delay += random.uniform(0, delay)  # noqa: S311
+                logger.warning(
+                    "Embedding request throttled, retrying.",
+                    attempt=attempt + 1,
+                    delay=round(delay, 2),
+                )
+                with self._stats_lock:
+                    self.stats.retries += 1
+                attempt += 1
+                time.sleep(delay)
@@ -6,20 +6,34 @@ with Google's Generative AI service. It handles chat sessions, content generatio
 and message management while maintaining a consistent AI personality.
 """
 
+import asyncio
+from collections.abc import Sequence
 from typing import Any, override
 
 import structlog
-from google.generativeai.client import configure
+from google.generativeai import protos
+from google.generativeai.client import (
+    configure,
+    get_default_generative_async_client,
+    get_default_generative_client,
+)
 from google.generativeai.embedding import (
+    EMBEDDING_MAX_BATCH_SIZE,
     EmbeddingTaskType,
+    to_task_type,
 )
 from google.generativeai.embedding import (
     embed_content as _embed_content,
 )
+from google.generativeai.embedding import (
+    embed_content_async as _embed_content_async,
+)
 from google.generativeai.generative_models import ChatSession, GenerativeModel
-from google.generativeai.types import GenerationConfig
+from google.generativeai.types import GenerationConfig, content_types
+from google.generativeai.types.model_types import make_model_name
 
 from flare_ai_rag.ai.base import BaseAIProvider, ModelResponse
+from flare_ai_rag.ai.embedding_cache import EmbeddingCache, content_hash
 
 logger = structlog.get_logger(__name__)
 
@@ -184,15 +198,18 @@ class GeminiProvider(BaseAIProvider):
 
 
 class GeminiEmbedding:
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, cache: EmbeddingCache | None = None) -> None:
         """
         Initialize Gemini with API credentials.
         This client uses google.generativeai
 
         Args:
             api_key (str): Google API key for authentication
+            cache (EmbeddingCache | None): Optional persistent cache consulted
+                before any embedding request is sent.
         """
         configure(api_key=api_key)
+        self.cache = cache
 
     def embed_content(
         self,
@@ -211,6 +228,14 @@ class GeminiEmbedding:
         Returns:
             list[float]: The generated embedding vector.
         """
+        cache = self._persistent_cache(task_type)
+        key = None
+        if cache is not None:
+            key = content_hash(embedding_model, task_type, title, contents)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
         response = _embed_content(
             model=embedding_model, content=contents, task_type=task_type, title=title
         )
@@ -219,4 +244,149 @@ class GeminiEmbedding:
         except (KeyError, IndexError) as e:
             msg = "Failed to extract embedding from response."
             raise ValueError(msg) from e
+
+        if cache is not None and key is not None:
+            cache.put(key, embedding)
+        return embedding
+
+    async def embed_content_async(
+        self,
+        embedding_model: str,
+        contents: str,
+        task_type: EmbeddingTaskType,
+        title: str | None = None,
+    ) -> list[float]:
+        """
+        Generate text embeddings using Gemini without blocking the event loop.
+        Cache lookups and writes, which may flush to disk, run in a worker thread.
+
+        Args:
+            embedding_model (str): The embedding model to use.
+            contents (str): The text to be embedded.
+            task_type (EmbeddingTaskType): The embedding task type.
+            title (str | None): Optional document title.
+
+        Returns:
+            list[float]: The generated embedding vector.
+        """
+        cache = self._persistent_cache(task_type)
+        key = None
+        if cache is not None:
+            key = content_hash(embedding_model, task_type, title, contents)
+            cached = await asyncio.to_thread(cache.get, key)
+            if cached is not None:
+                return cached
+
+        response = await _embed_content_async(
+            model=embedding_model, content=contents, task_type=task_type, title=title
+        )
+        try:
+            embedding = response["embedding"]
+        except (KeyError, IndexError) as e:
+            msg = "Failed to extract embedding from response."
+            raise ValueError(msg) from e
+
+        if cache is not None and key is not None:
+            await asyncio.to_thread(cache.put, key, embedding)
         return embedding
+
+    def _persistent_cache(self, task_type: EmbeddingTaskType) -> EmbeddingCache | None:
+        """
+        Return the persistent cache to use for `task_type`, if any.
+
+        Query embeddings bypass it: retrievers keep them in their in-process
+        query cache, and storing them here would evict document vectors.
+        """
+        if to_task_type(task_type) == EmbeddingTaskType.RETRIEVAL_QUERY:
+            return None
+        return self.cache
+
+    def embed_contents(
+        self,
+        embedding_model: str,
+        contents: Sequence[str],
+        task_type: EmbeddingTaskType,
+        titles: Sequence[str | None] | None = None,
+    ) -> list[list[float]]:
+        """
+        Generate embeddings for several texts in a single batch request.
+        The cache is not consulted here; `BatchEmbeddingEngine` handles it.
+
+        Args:
+            embedding_model (str): The embedding model to use.
+            contents (Sequence[str]): The texts to be embedded, at most
+                `EMBEDDING_MAX_BATCH_SIZE` of them.
+            task_type (EmbeddingTaskType): The embedding task type.
+            titles (Sequence[str | None] | None): Optional per-text titles, only
+                applicable to document embeddings.
+
+        Returns:
+            list[list[float]]: One embedding vector per input text, in order.
+        """
+        response = get_default_generative_client().batch_embed_contents(
+            _batch_embed_request(embedding_model, contents, task_type, titles)
+        )
+        return _batch_embeddings(response, len(contents))
+
+    async def embed_contents_async(
+        self,
+        embedding_model: str,
+        contents: Sequence[str],
+        task_type: EmbeddingTaskType,
+        titles: Sequence[str | None] | None = None,
+    ) -> list[list[float]]:
+        """
+        Generate embeddings for several texts in a single batch request, without
+        blocking the event loop. The cache is not consulted here.
+
+        Args:
+            embedding_model (str): The embedding model to use.
+            contents (Sequence[str]): The texts to be embedded, at most
+                `EMBEDDING_MAX_BATCH_SIZE` of them.
+            task_type (EmbeddingTaskType): The embedding task type.
+            titles (Sequence[str | None] | None): Optional per-text titles, only
+                applicable to document embeddings.
+
+        Returns:
+            list[list[float]]: One embedding vector per input text, in order.
+        """
+        response = await get_default_generative_async_client().batch_embed_contents(
+            _batch_embed_request(embedding_model, contents, task_type, titles)
+        )
+        return _batch_embeddings(response, len(contents))
+
+
+def _batch_embed_request(
+    embedding_model: str,
+    contents: Sequence[str],
+    task_type: EmbeddingTaskType,
+    titles: Sequence[str | None] | None,
+) -> protos.BatchEmbedContentsRequest:
+    """Build the request embedding several texts at once."""
+    if len(contents) > EMBEDDING_MAX_BATCH_SIZE:
+        msg = f"At most {EMBEDDING_MAX_BATCH_SIZE} texts can be embedded at once."
+        raise ValueError(msg)
+    if titles is None:
+        titles = [None] * len(contents)
+    model = make_model_name(embedding_model)
+    requests = [
+        protos.EmbedContentRequest(
+            model=model,
+            content=content_types.to_content(text),
+            task_type=to_task_type(task_type),
+            title=title,
+        )
+        for text, title in zip(contents, titles, strict=True)
+    ]
+    return protos.BatchEmbedContentsRequest(model=model, requests=requests)
+
+
+def _batch_embeddings(
+    response: protos.BatchEmbedContentsResponse, expected: int
+) -> list[list[float]]:
+    """Extract the vectors of a batch response, checking none are missing."""
+    embeddings = [list(embedding.values) for embedding in response.embeddings]
+    if len(embeddings) != expected:
+        msg = "Failed to extract embeddings from batch response."
+        raise ValueError(msg)
+    return embeddings
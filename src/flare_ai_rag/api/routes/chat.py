@@ -1,3 +1,4 @@
+import google.api_core.exceptions
 import structlog
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
@@ -6,7 +7,11 @@ from flare_ai_rag.ai import GeminiProvider
 from flare_ai_rag.attestation import Vtpm, VtpmAttestationError
 from flare_ai_rag.prompts import PromptService, SemanticRouterResponse
 from flare_ai_rag.responder import GeminiResponder
-from flare_ai_rag.retriever import QdrantRetriever
+from flare_ai_rag.retriever import (
+    AsyncBaseRetriever,
+    PipelineContext,
+    SemanticAnswerCache,
+)
 from flare_ai_rag.router import GeminiRouter
 
 logger = structlog.get_logger(__name__)
@@ -37,10 +42,11 @@ class ChatRouter:
         router: APIRouter,
         ai: GeminiProvider,
         query_router: GeminiRouter,
-        retriever: QdrantRetriever,
+        retriever: AsyncBaseRetriever,
         responder: GeminiResponder,
         attestation: Vtpm,
         prompts: PromptService,
+        answer_cache: SemanticAnswerCache | None = None,
     ) -> None:
         """
         Initialize the ChatRouter.
@@ -51,10 +57,13 @@ class ChatRouter:
                 to determine if an attestation was requested or if RAG
                 pipeline should be used.
             query_router: RAG Component that classifies the query.
-            retriever: RAG Component that retrieves relevant documents.
+            retriever: RAG Component that retrieves relevant documents without
+                blocking the event loop.
             responder: RAG Component that generates a response.
             attestation (Vtpm): Provider for attestation services
             prompts (PromptService): Service for managing prompts
+            answer_cache (SemanticAnswerCache | None): Optional cache answering
+                paraphrases of recent RAG questions without running the pipeline
         """
         self._router = router
         self.ai = ai
@@ -63,6 +72,7 @@ class ChatRouter:
         self.responder = responder
         self.attestation = attestation
         self.prompts = prompts
+        self.answer_cache = answer_cache
         self.logger = logger.bind(router="chat")
         self._setup_routes()
 
@@ -101,6 +111,46 @@ class ChatRouter:
         """Return the underlying FastAPI router with registered endpoints."""
         return self._router
 
+    async def get_cached_answer(
+        self, context: PipelineContext
+    ) -> dict[str, str] | None:
+        """
+        Look up the answer of an earlier RAG question close enough to this one.
+
+        Args:
+            context: Context of the request; its query vector is computed here
+                and reused by the rest of the pipeline
+
+        Returns:
+            dict[str, str] | None: The cached RAG response, or None on a miss
+        """
+        if self.answer_cache is None:
+            return None
+        try:
+            query_vector = await context.embed(self.retriever)
+        except (google.api_core.exceptions.GoogleAPIError, ValueError) as e:
+            # The pipeline runs on without the cache; retrieval re-raises the
+            # same error and reports it there.
+            self.logger.warning("answer_cache_lookup_failed", error=str(e))
+            return None
+        answer = self.answer_cache.get(query_vector)
+        if answer is None:
+            return None
+        self.logger.info("Answer served from cache", **self.answer_cache.stats())
+        return {"classification": "ANSWER", "response": answer}
+
+    async def cache_answer(self, context: PipelineContext, answer: str) -> None:
+        """
+        Store a generated RAG answer for later paraphrases of the request query.
+
+        Args:
+            context: Context of the answered request
+            answer: The generated answer
+        """
+        if self.answer_cache is None:
+            return
+        self.answer_cache.put(await context.embed(self.retriever), answer)
+
     async def get_semantic_route(self, message: str) -> SemanticRouterResponse:
         """
         Determine the semantic route for a message using AI provider.
@@ -148,31 +198,56 @@ class ChatRouter:
 
         return await handler(message)
 
-    async def handle_rag_pipeline(self, _: str) -> dict[str, str]:
+    async def handle_rag_pipeline(self, message: str) -> dict[str, str]:
         """
-        Handle attestation requests.
+        Handle RAG requests.
+
+        The query is embedded once: the answer cache is only consulted on this
+        route, and on a miss the same vector is used to retrieve the documents,
+        which are shared with the query router and the responder through the
+        request's pipeline context. As in `RetrievalService.search`, a retrieval
+        failure is logged and the query is classified without documents.
 
         Args:
-            _: Unused message parameter
+            message: The user message
 
         Returns:
-            dict[str, str]: Response containing attestation request
+            dict[str, str]: Response containing the classification and the answer
         """
-        # Step 1. Classify the user query.
+        context = PipelineContext(query=message)
+        cached = await self.get_cached_answer(context)
+        if cached is not None:
+            return cached
+
+        # Step 1. Retrieve relevant documents.
+        retrieval_failed = False
+        try:
+            retrieved_docs = await context.retrieve(self.retriever, top_k=5)
+        except Exception:
+            self.logger.exception("retrieval_failed", query=message)
+            # Leave the later stages an empty result rather than a second search
+            retrieved_docs = context.documents = []
+            retrieval_failed = True
+        self.logger.info("Documents retrieved", documents=len(retrieved_docs))
+
+        # Step 2. Classify the user query.
         prompt, mime_type, schema = self.prompts.get_formatted_prompt("rag_router")
         classification = self.query_router.route_query(
-            prompt=prompt, response_mime_type=mime_type, response_schema=schema
+            prompt=prompt,
+            response_mime_type=mime_type,
+            response_schema=schema,
+            pipeline_context=context,
         )
         self.logger.info("Query classified", classification=classification)
 
         if classification == "ANSWER":
-            # Step 2. Retrieve relevant documents.
-            retrieved_docs = self.retriever.semantic_search(_, top_k=5)
-            self.logger.info("Documents retrieved")
-
             # Step 3. Generate the final answer.
-            answer = self.responder.generate_response(_, retrieved_docs)
+            answer = self.responder.generate_response(
+                message, retrieved_docs, pipeline_context=context
+            )
             self.logger.info("Response generated", answer=answer)
+            if not retrieval_failed:
+                await self.cache_answer(context, answer)
             return {"classification": classification, "response": answer}
 
         # Map static responses for CLARIFY and REJECT.
@@ -0,0 +1,76 @@
+import json
+from array import array
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+CHUNKS_FILE = "chunks.jsonl"
+INDEX_FILE = "chunks.idx"
+
+
+def write_chunk_store(records: Iterable[dict], output_folder: str | Path) -> int:
+    """
+    Writes chunk records to a single JSONL file with an offset index.
+
+    Every record is stored on its own line of `chunks.jsonl`, and the byte offset
+    of each line is stored as an unsigned 64-bit integer in `chunks.idx`, so the
+    store can be read sequentially or accessed at random.
+    :param records: The chunk records to store.
+    :param output_folder: Folder where the store is written.
+    :return: The number of records written.
+    """
+    folder = Path(output_folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    offsets = array("Q")
+    chunks_path = folder / CHUNKS_FILE
+    index_path = folder / INDEX_FILE
+    chunks_tmp = folder / f"{CHUNKS_FILE}.tmp"
+    index_tmp = folder / f"{INDEX_FILE}.tmp"
+
+    with chunks_tmp.open("wb") as chunks_file:
+        for record in records:
+            offsets.append(chunks_file.tell())
+            chunks_file.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+            chunks_file.write(b"\n")
+    with index_tmp.open("wb") as index_file:
+        offsets.tofile(index_file)
+
+    # Swap both files in only once they are complete.
+    chunks_tmp.replace(chunks_path)
+    index_tmp.replace(index_path)
+    return len(offsets)
+
+
+def chunk_store_exists(folder: str | Path) -> bool:
+    """
+    Checks whether a chunk store has been written to a folder.
+    :param folder: Folder holding the store.
+    :return: True if both the chunk file and its index exist.
+    """
+    return all((Path(folder) / name).exists() for name in (CHUNKS_FILE, INDEX_FILE))
+
+
+def iter_chunk_store(folder: str | Path) -> Iterator[dict]:
+    """
+    Reads every chunk record sequentially, in the order they were written.
+    :param folder: Folder holding the store.
+    :return: An iterator over the chunk records.
+    """
+    with (Path(folder) / CHUNKS_FILE).open("rb") as chunks_file:
+        for line in chunks_file:
+            yield json.loads(line)
+
+
+def read_chunk(folder: str | Path, position: int) -> dict:
+    """
+    Reads a single chunk record through the offset index.
+    :param folder: Folder holding the store.
+    :param position: Position of the record in the store.
+    :return: The chunk record.
+    """
+    offsets = array("Q")
+    with (Path(folder) / INDEX_FILE).open("rb") as index_file:
+        index_file.seek(position * offsets.itemsize)
+        offsets.fromfile(index_file, 1)
+    with (Path(folder) / CHUNKS_FILE).open("rb") as chunks_file:
+        chunks_file.seek(offsets[0])
+        return json.loads(chunks_file.readline())
@@ -1,37 +1,129 @@
 import os
-import json
 import re
 import csv
+import itertools
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 
+import structlog
 
-def clean_text(text: str) -> str:
+from flare_ai_rag.data_preprocessing.chunk_store import write_chunk_store
+
+logger = structlog.get_logger(__name__)
+
+
+# Characters removed by each cleaning profile, compiled once at import time.
+# "ascii" keeps plain alphanumerics and basic punctuation only; "unicode" keeps
+# every printable character (code symbols, accents, arrows, ...) and only drops
+# control and zero-width characters.
+_INVISIBLE = r"\x00-\x08\x0b\x0c\x0e-\x1f\x7f\u200b-\u200f\u2060\ufeff"
+_INVISIBLE_PATTERN = re.compile(f"[{_INVISIBLE}]+")
+# "markdown" also keeps line breaks, headings, code fences and inline code
+# verbatim, and strips the MDX/JSX syntax of the docs: import/export lines,
+# component and HTML tags, comments, and link targets (the label is kept).
+# Alternatives are tried left to right, so code is matched before anything
+# inside it could be.
+_TAG = r"</?[A-Za-z][\w.:-]*(?:\s[^<>]*)?/?>"
+_MARKDOWN_PATTERN = re.compile(
+    r"(?P<fence>^(?P<tick>`{3,}|~{3,})[^\n]*\n.*?(?:^(?P=tick)[ \t]*$|\Z))"
+    r"|(?P<code>`[^`\n]+`)"
+    r"|^(?:import|export)\s[^\n]*\n?"
+    r"|<!--.*?-->"
+    r"|!?\[(?P<label>[^\]\n]*)\]\([^)\n]*\)"
+    rf"|^[ \t]*(?:{_TAG}[ \t]*)+\n|{_TAG}"  # Lines holding only tags go entirely
+    rf"|[ \t{_INVISIBLE}]+$"
+    r"|(?P<blank>\n(?:[ \t]*\n){2,})"
+    rf"|[{_INVISIBLE}]+",
+    re.MULTILINE | re.DOTALL,
+)
+CLEAN_PATTERNS = {
+    "ascii": re.compile(r'[^a-zA-Z0-9.,?!:;()"\s]+'),
+    "unicode": _INVISIBLE_PATTERN,
+    "markdown": _MARKDOWN_PATTERN,
+}
+
+
+def _markdown_replacement(match: re.Match[str]) -> str:
+    """Returns what a `_MARKDOWN_PATTERN` match is replaced with."""
+    if match["fence"] is not None:
+        return _INVISIBLE_PATTERN.sub("", match["fence"])
+    if match["code"] is not None:
+        return _INVISIBLE_PATTERN.sub("", match["code"])
+    if match["label"] is not None:
+        return match["label"]
+    if match["blank"] is not None:
+        return "\n\n"  # Keep at most one blank line in a row
+    return ""
+
+
+def clean_text(text: str, profile: str = "ascii") -> str:
     """
     Removes unnecessary symbols, extra spaces, and formats text properly.
+
+    Symbols are dropped with a single precompiled regex pass. The "ascii" and
+    "unicode" profiles then join the text into a single line; "markdown" keeps
+    line breaks and code, removing MDX/JSX syntax in the same pass.
     :param text: The text to be cleaned.
+    :param profile: "ascii", "unicode" or "markdown".
     :return: Cleaned text as a string.
     """
-    text = re.sub(r'\s+', ' ', text)  # Removes extra spaces
-    text = re.sub(r'[^a-zA-Z0-9.,?!:;()"\s]', '', text)  # Removes weird symbols
-    return text.strip()
+    pattern = CLEAN_PATTERNS.get(profile)
+    if pattern is None:
+        msg = (
+            f"Unknown cleaning profile: {profile!r}. "
+            f"Expected one of {sorted(CLEAN_PATTERNS)}."
+        )
+        raise ValueError(msg)
+
+    if profile == "markdown":
+        return pattern.sub(_markdown_replacement, text).strip()
+    return " ".join(pattern.sub("", text).split())
+
+
+# A token is a single punctuation mark or about every CHARS_PER_TOKEN characters
+# of a run of word characters, so long identifiers, hashes and URLs count as
+# several tokens. This tracks subword tokenizers closely enough for budgeting
+# without a tokenizer dependency.
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+CHARS_PER_TOKEN = 4
+HEADING_PATTERN = re.compile(r"^#{1,6}\s", re.MULTILINE)
+SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+
+def count_tokens(text: str) -> int:
+    """
+    Approximates the number of model tokens in a text.
+    :param text: The text to measure.
+    :return: The approximate token count.
+    """
+    return sum(
+        max(1, len(token) // CHARS_PER_TOKEN) for token in TOKEN_PATTERN.findall(text)
+    )
 
 
 def split_text(text: str, chunk_size: int = 500) -> list[str]:
     """
-    Splits a document into smaller chunks, ensuring sentences are not cut.
+    Splits a document into smaller chunks, ensuring words are not cut.
+    Runs in linear time by tracking the length of the current chunk.
     :param text: The text to split.
     :param chunk_size: The maximum size of each chunk.
     :return: A list of smaller text chunks.
     """
-    words = text.split()
     chunks = []
-    current_chunk = []
+    current_chunk: list[str] = []
+    current_length = 0  # len(" ".join(current_chunk))
 
-    for word in words:
-        if len(" ".join(current_chunk)) + len(word) < chunk_size:
+    for word in text.split():
+        if current_length + len(word) < chunk_size or not current_chunk:
+            current_length += len(word) + (1 if current_chunk else 0)
             current_chunk.append(word)
         else:
             chunks.append(" ".join(current_chunk))
             current_chunk = [word]
+            current_length = len(word)
 
     if current_chunk:
         chunks.append(" ".join(current_chunk))
@@ -39,50 +131,274 @@ def split_text(text: str, chunk_size: int = 500) -> list[str]:
     return chunks
 
 
-def preprocess_documents(input_folder: str = "data", output_folder: str = "processed_data") -> None:
+def _segments(text: str, boundary: str) -> list[tuple[str, bool]]:
+    """
+    Splits a text into (segment, starts_section) pairs at the requested boundary.
+    :param text: The text to split.
+    :param boundary: "heading", "sentence" or "word".
+    :return: The segments, flagged when they open a markdown section.
+    """
+    sections = [text]
+    if boundary in ("heading", "sentence"):
+        starts = [m.start() for m in HEADING_PATTERN.finditer(text)]
+        bounds = [0, *[start for start in starts if start > 0], len(text)]
+        sections = [text[a:b] for a, b in itertools.pairwise(bounds)]
+
+    segments = []
+    for section in sections:
+        if boundary == "sentence":
+            parts = SENTENCE_END_PATTERN.split(section)
+        elif boundary == "heading":
+            parts = [section]
+        else:
+            parts = section.split()
+        parts = [part.strip() for part in parts if part.strip()]
+        segments.extend((part, idx == 0) for idx, part in enumerate(parts))
+    return segments
+
+
+def _fitting_pieces(
+    segment: str, max_tokens: int, token_counter: Callable[[str], int]
+) -> Iterator[tuple[str, int]]:
+    """
+    Yields a segment as (piece, tokens) pairs that each fit the token budget.
+    Oversized segments fall back to word boundaries; a single word over budget
+    (minified code, long URLs) is halved until it fits.
+    :param segment: The segment to split.
+    :param max_tokens: The maximum number of tokens per piece.
+    :param token_counter: Function returning the token count of a string.
+    :return: An iterator of pieces with their token counts.
+    """
+    tokens = token_counter(segment)
+    if tokens <= max_tokens:
+        yield segment, tokens
+        return
+    for word in segment.split():
+        pieces = [word]
+        while pieces:
+            piece = pieces.pop()
+            piece_tokens = token_counter(piece)
+            if piece_tokens <= max_tokens or len(piece) == 1:
+                yield piece, piece_tokens
+            else:
+                middle = len(piece) // 2
+                pieces.extend((piece[middle:], piece[:middle]))
+
+
+@dataclass(frozen=True)
+class ChunkingOptions:
+    """
+    How every document is split and cleaned.
+    :param max_tokens: The maximum number of tokens per chunk.
+    :param overlap_tokens: Tokens shared between consecutive chunks.
+    :param clean_profile: Profile passed to `clean_text` ("ascii", "unicode" or
+        "markdown"); the default keeps code symbols used throughout the docs.
+        Changing it changes every chunk's text, so the next sync re-embeds the
+        whole corpus.
+    """
+
+    max_tokens: int = 256
+    overlap_tokens: int = 32
+    clean_profile: str = "unicode"
+
+    def __post_init__(self) -> None:
+        if self.clean_profile not in CLEAN_PATTERNS:
+            msg = (
+                f"Unknown cleaning profile: {self.clean_profile!r}. "
+                f"Expected one of {sorted(CLEAN_PATTERNS)}."
+            )
+            raise ValueError(msg)
+
+
+class _ChunkPacker:
     """
-    Reads CSV files, extracts text, cleans, splits into chunks, and stores metadata.
+    Packs token-counted segments into chunks with a running token counter, carrying
+    up to `overlap_tokens` tokens of trailing context into the next chunk.
+    """
+
+    def __init__(self, max_tokens: int, overlap_tokens: int) -> None:
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.chunks: list[str] = []
+        self.current: list[tuple[str, int]] = []
+        self.current_tokens = 0
+        self.fresh_tokens = 0  # tokens not carried over from the previous chunk
+
+    def add(self, segment: str, tokens: int) -> None:
+        """Appends a segment, closing the current chunk first if it would overflow."""
+        if self.current_tokens + tokens > self.max_tokens:
+            self.flush()
+            if self.current_tokens + tokens > self.max_tokens:
+                self.reset()
+        self.current.append((segment, tokens))
+        self.current_tokens += tokens
+        self.fresh_tokens += tokens
+
+    def flush(self) -> None:
+        """Closes the current chunk, keeping its tail as overlap for the next one."""
+        if self.fresh_tokens:
+            self.chunks.append(" ".join(segment for segment, _ in self.current))
+        tail: list[tuple[str, int]] = []
+        tail_tokens = 0
+        for segment, tokens in reversed(self.current):
+            if tail_tokens + tokens > self.overlap_tokens:
+                break
+            tail.append((segment, tokens))
+            tail_tokens += tokens
+        self.current, self.current_tokens = tail[::-1], tail_tokens
+        self.fresh_tokens = 0
+
+    def reset(self) -> None:
+        """Drops the carried-over overlap."""
+        self.current, self.current_tokens = [], 0
+
+
+def chunk_text(
+    text: str,
+    max_tokens: int = 256,
+    overlap_tokens: int = 32,
+    boundary: str = "sentence",
+    token_counter: Callable[[str], int] = count_tokens,
+) -> list[str]:
+    """
+    Splits a document into token-budgeted chunks in linear time.
+
+    The text is cut at sentence (or heading, or word) boundaries, every segment is
+    measured once, and chunks are packed with a running token counter. A new chunk
+    is started at every markdown heading, and consecutive chunks share up to
+    `overlap_tokens` tokens of trailing context.
+    :param text: The text to split.
+    :param max_tokens: The maximum number of tokens per chunk.
+    :param overlap_tokens: Tokens repeated from the end of the previous chunk.
+    :param boundary: "heading", "sentence" or "word".
+    :param token_counter: Function returning the token count of a string.
+    :return: A list of text chunks.
+    """
+    if max_tokens <= 0 or not 0 <= overlap_tokens < max_tokens:
+        msg = "Expected max_tokens > 0 and 0 <= overlap_tokens < max_tokens."
+        raise ValueError(msg)
+
+    packer = _ChunkPacker(max_tokens, overlap_tokens)
+    for segment, starts_section in _segments(text, boundary):
+        if starts_section and boundary != "word":
+            # Never let a chunk (or its overlap) straddle two sections.
+            packer.flush()
+            packer.reset()
+        for piece, tokens in _fitting_pieces(segment, max_tokens, token_counter):
+            packer.add(piece, tokens)
+
+    packer.flush()
+    return packer.chunks
+
+
+def _chunk_rows(
+    rows: list[tuple[str, dict[str, str]]],
+    original: str,
+    options: ChunkingOptions,
+) -> list[dict]:
+    """
+    Splits and cleans a batch of CSV rows; runs inside a worker process.
+    :param rows: (document_key, row) pairs to process.
+    :param original: Name of the CSV file the rows come from.
+    :param options: How the rows are split and cleaned.
+    :return: One record per chunk, in row and chunk order.
+    """
+    records = []
+    for document_key, row in rows:
+        # Chunk the raw text so headings still mark boundaries, then clean
+        chunks = [
+            cleaned
+            for chunk in chunk_text(
+                row["content"], options.max_tokens, options.overlap_tokens
+            )
+            if (cleaned := clean_text(chunk, options.clean_profile))
+        ]
+        for idx, chunk in enumerate(chunks):
+            records.append(
+                {
+                    "original": original,
+                    "document_key": document_key,
+                    "file_name": row.get("file_name", original),
+                    "chunk_index": idx,
+                    "chunk_count": len(chunks),
+                    "title": row.get("title", "Unknown Title"),
+                    "author": row.get("author", "Unknown Author"),
+                    "date": row.get("date", "Unknown Date"),
+                    "meta_data": row.get("meta_data", ""),
+                    "text": chunk,
+                }
+            )
+    return records
+
+
+def _read_row_batches(
+    input_folder: str, batch_size: int
+) -> Iterator[tuple[str, list[tuple[str, dict[str, str]]]]]:
+    """
+    Streams (csv_filename, [(document_key, row), ...]) batches from every CSV file.
+
+    The document key is the row's file name; repeated file names are numbered
+    ("name~1", "name~2", ...) so every document keeps a distinct, stable key.
     :param input_folder: Folder where the CSV files are stored.
-    :param output_folder: Folder where processed chunks will be stored.
-    """
-    os.makedirs(output_folder, exist_ok=True)
-    metadata = []
-
-    for filename in os.listdir(input_folder):
-        filepath = os.path.join(input_folder, filename)
-
-        # Process CSV files
-        if filename.endswith(".csv"):
-            with open(filepath, "r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if "content" in row:  # Ensure content column exists
-                        text = clean_text(row["content"])  # Extract and clean text
-                        title = row.get("title", "Unknown Title")
-                        author = row.get("author", "Unknown Author")
-                        date = row.get("date", "Unknown Date")
-
-                        chunks = split_text(text)
-                        for idx, chunk in enumerate(chunks):
-                            chunk_filename = f"{filename}_chunk{idx}.txt"
-                            chunk_path = os.path.join(output_folder, chunk_filename)
-
-                            with open(chunk_path, "w", encoding="utf-8") as chunk_file:
-                                chunk_file.write(chunk)
-
-                            metadata.append({
-                                "filename": chunk_filename,
-                                "original": filename,
-                                "title": title,
-                                "author": author,
-                                "date": date
-                            })
-
-    # Save metadata
-    with open(os.path.join(output_folder, "metadata.json"), "w", encoding="utf-8") as meta_file:
-        json.dump(metadata, meta_file, indent=4)
-
-    print("Preprocessing complete!")
+    :param batch_size: Number of rows per batch.
+    :return: An iterator over row batches.
+    """
+    for path in sorted(Path(input_folder).glob("*.csv")):
+        filename = path.name
+        occurrences: dict[str, int] = {}
+        with path.open(encoding="utf-8") as file:
+            reader = csv.DictReader(file)
+            # Ensure content column exists
+            if "content" not in (reader.fieldnames or []):
+                continue
+            while rows := list(itertools.islice(reader, batch_size)):
+                batch = []
+                for row in rows:
+                    name = row.get("file_name", filename)
+                    occurrence = occurrences.get(name, 0)
+                    occurrences[name] = occurrence + 1
+                    key = name if occurrence == 0 else f"{name}~{occurrence}"
+                    batch.append((key, row))
+                yield filename, batch
+
+
+def preprocess_documents(
+    input_folder: str = "data",
+    output_folder: str = "processed_data",
+    options: ChunkingOptions | None = None,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> None:
+    """
+    Reads CSV files, extracts text, splits into chunks, cleans, and stores them.
+
+    Row batches are fanned out across a process pool and the resulting chunks and
+    their metadata are written, in input order, to a single chunk store (see
+    `chunk_store.write_chunk_store`).
+    :param input_folder: Folder where the CSV files are stored.
+    :param output_folder: Folder where the chunk store will be written.
+    :param options: How documents are split and cleaned (defaults to
+        `ChunkingOptions()`).
+    :param max_workers: Number of worker processes (defaults to the CPU count).
+    :param batch_size: Number of CSV rows handed to a worker at once.
+    """
+    options = options or ChunkingOptions()
+    max_workers = max_workers or os.cpu_count() or 1
+
+    def chunk_records() -> Iterator[dict]:
+        # Keep a bounded window of batches in flight so memory stays flat.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending: deque[Future[list[dict]]] = deque()
+            for original, rows in _read_row_batches(input_folder, batch_size):
+                pending.append(executor.submit(_chunk_rows, rows, original, options))
+                if len(pending) >= 2 * max_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    num_chunks = write_chunk_store(chunk_records(), output_folder)
+
+    logger.info("Preprocessing complete.", chunks=num_chunks)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,10 @@ It sets up CORS middleware, loads configuration and data, and wires together the
 Gemini-based Router, Retriever, and Responder components into a chat endpoint.
 """
 
-import pandas as pd
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 import structlog
 import uvicorn
 import os
@@ -15,22 +18,53 @@ from fastapi.middleware.cors import CORSMiddleware
 from qdrant_client import QdrantClient
 import json
 
-from flare_ai_rag.ai import GeminiEmbedding, GeminiProvider
+from flare_ai_rag.ai import EmbeddingCache, GeminiEmbedding, GeminiProvider
 from flare_ai_rag.api import ChatRouter
 from flare_ai_rag.attestation import Vtpm
 from flare_ai_rag.prompts import PromptService
 from flare_ai_rag.responder import GeminiResponder, ResponderConfig
-from flare_ai_rag.retriever import QdrantRetriever, RetrieverConfig, generate_collection
+from flare_ai_rag.retriever import (
+    AsyncBaseRetriever,
+    AsyncQdrantRetriever,
+    AsyncRetrieverAdapter,
+    BM25Index,
+    NumpyRetriever,
+    NumpyVectorIndex,
+    QdrantRetriever,
+    QueryVectorCache,
+    RetrievalService,
+    RetrieverConfig,
+    SemanticAnswerCache,
+    bm25_index_path,
+    collection_version_path,
+    create_async_qdrant_client,
+    create_qdrant_client,
+    generate_collection,
+    read_collection_version,
+    vector_index_path,
+)
 from flare_ai_rag.router import GeminiRouter, RouterConfig
 from flare_ai_rag.settings import settings
-from flare_ai_rag.utils import load_json
+from flare_ai_rag.utils import iter_csv_chunks, load_json
 from flare_ai_rag.data_preprocessing.preprocess import preprocess_documents
 from flare_ai_rag.data_preprocessing.extract_bigquery import fetch_google_trends, fetch_github_data
 
 logger = structlog.get_logger(__name__)
 
 
-def setup_router(input_config: dict) -> tuple[GeminiProvider, GeminiRouter]:
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    """Persist the embedding cache index on shutdown."""
+    yield
+    embedding_cache: EmbeddingCache | None = getattr(app.state, "embedding_cache", None)
+    if embedding_cache is not None:
+        embedding_cache.flush()
+        logger.info("Embedding cache flushed.", entries=len(embedding_cache))
+
+
+def setup_router(
+    input_config: dict, retrieval: RetrievalService
+) -> tuple[GeminiProvider, GeminiRouter]:
     """Initialize a Gemini Provider for routing."""
     router_model_config = input_config["router_model"]
     router_config = RouterConfig.load(router_model_config)
@@ -38,7 +72,9 @@ def setup_router(input_config: dict) -> tuple[GeminiProvider, GeminiRouter]:
     gemini_provider = GeminiProvider(
         api_key=settings.gemini_api_key, model=router_config.model.model_id
     )
-    gemini_router = GeminiRouter(client=gemini_provider, config=router_config)
+    gemini_router = GeminiRouter(
+        client=gemini_provider, config=router_config, retrieval=retrieval
+    )
 
     return gemini_provider, gemini_router
 
@@ -46,11 +82,23 @@ def setup_router(input_config: dict) -> tuple[GeminiProvider, GeminiRouter]:
 def setup_retriever(
     qdrant_client: QdrantClient,
     input_config: dict,
-    df_docs: pd.DataFrame,
-) -> QdrantRetriever:
-    """Initialize the Qdrant retriever."""
+    docs_path: Path,
+) -> QdrantRetriever | NumpyRetriever:
+    """
+    Initialize the retriever of the configured backend.
+
+    Qdrant always stores the synchronized collection. With the "numpy" backend,
+    it is an embedded Qdrant (see `setup_qdrant`), and the collection is exported
+    into an in-process index that serves queries; the export is skipped when the
+    collection version did not change since the last one.
+    """
     retriever_config = RetrieverConfig.load(input_config["retriever_config"])
-    embedding_client = GeminiEmbedding(settings.gemini_api_key)
+    embedding_cache = EmbeddingCache(
+        settings.embedding_cache_path,
+        vector_size=retriever_config.vector_size,
+        max_entries=retriever_config.embedding_cache_max_entries,
+    )
+    embedding_client = GeminiEmbedding(settings.gemini_api_key, cache=embedding_cache)
 
     # ✅ Preprocess Documents Before Generating Collection
     preprocess_documents(input_folder="data", output_folder="processed_data")
@@ -59,9 +107,13 @@ def setup_retriever(
     fetch_google_trends()
     fetch_github_data()
 
-    # (Re)generate Qdrant collection with preprocessed & external data
+    # Synchronize Qdrant collection with preprocessed & external data
     generate_collection(
-        df_docs,
+        iter_csv_chunks(
+            docs_path,
+            chunksize=retriever_config.csv_chunk_size,
+            usecols=["file_name", "meta_data", "content"],
+        ),
         qdrant_client,
         retriever_config,
         embedding_client=embedding_client,
@@ -70,25 +122,104 @@ def setup_retriever(
         "The Qdrant collection has been generated.",
         collection_name=retriever_config.collection_name,
     )
+    query_cache = QueryVectorCache(
+        max_entries=retriever_config.query_cache_max_entries,
+        ttl_seconds=retriever_config.query_cache_ttl_seconds,
+    )
+
+    if retriever_config.backend == "numpy":
+        if retriever_config.retrieval_mode == "hybrid":
+            logger.warning("The numpy backend is dense-only, ignoring hybrid mode.")
+        index = NumpyVectorIndex.from_qdrant(
+            qdrant_client,
+            retriever_config.collection_name,
+            vector_index_path(retriever_config.collection_name),
+            version=read_collection_version(retriever_config.collection_name),
+        )
+        return NumpyRetriever(
+            index=index,
+            retriever_config=retriever_config,
+            embedding_client=embedding_client,
+            query_cache=query_cache,
+        )
+    if retriever_config.backend != "qdrant":
+        msg = f"Unknown retriever backend: {retriever_config.backend}"
+        raise ValueError(msg)
+
+    bm25_path = bm25_index_path(retriever_config.collection_name)
+    bm25_index = BM25Index.load(bm25_path) if bm25_path.exists() else None
 
     return QdrantRetriever(
         client=qdrant_client,
         retriever_config=retriever_config,
         embedding_client=embedding_client,
+        query_cache=query_cache,
+        bm25_index=bm25_index,
     )
 
 
 def setup_qdrant(input_config: dict) -> QdrantClient:
-    """Initialize Qdrant client."""
+    """
+    Initialize Qdrant client.
+
+    The "numpy" backend needs no Qdrant server: its collection is synchronized
+    into an embedded Qdrant persisted under `settings.qdrant_local_path`.
+    """
     logger.info("Setting up Qdrant client...")
     retriever_config = RetrieverConfig.load(input_config["retriever_config"])
-    qdrant_client = QdrantClient(host=retriever_config.host, port=retriever_config.port)
-    logger.info("Qdrant client has been set up.")
+    if retriever_config.backend == "numpy":
+        logger.info("Using embedded Qdrant.", path=str(settings.qdrant_local_path))
+        return QdrantClient(path=str(settings.qdrant_local_path))
+    qdrant_client = create_qdrant_client(retriever_config)
+    logger.info(
+        "Qdrant client has been set up.", prefer_grpc=retriever_config.prefer_grpc
+    )
 
     return qdrant_client
 
 
-def setup_responder(input_config: dict) -> GeminiResponder:
+def setup_async_retriever(
+    input_config: dict, retriever: QdrantRetriever | NumpyRetriever
+) -> AsyncBaseRetriever:
+    """
+    Initialize the async retriever used by the chat endpoint.
+
+    For Qdrant, it shares the embedding client, query cache and BM25 index of the
+    synchronous retriever but talks to Qdrant through an `AsyncQdrantClient`.
+    Other backends are searched in a worker thread.
+    """
+    retriever_config = RetrieverConfig.load(input_config["retriever_config"])
+    if not isinstance(retriever, QdrantRetriever):
+        return AsyncRetrieverAdapter(retriever)
+    return AsyncQdrantRetriever(
+        client=create_async_qdrant_client(retriever_config),
+        retriever_config=retriever_config,
+        embedding_client=retriever.embedding_client,
+        query_cache=retriever.query_cache,
+        bm25_index=retriever.bm25_index,
+    )
+
+
+def setup_answer_cache(input_config: dict) -> SemanticAnswerCache | None:
+    """
+    Initialize the semantic answer cache of the chat endpoint, if enabled.
+
+    The cache watches the collection version file, so its answers are dropped
+    whenever the collection is synchronized again with different content.
+    """
+    retriever_config = RetrieverConfig.load(input_config["retriever_config"])
+    if retriever_config.answer_cache_max_entries <= 0:
+        return None
+    return SemanticAnswerCache(
+        vector_size=retriever_config.vector_size,
+        max_entries=retriever_config.answer_cache_max_entries,
+        similarity_threshold=retriever_config.answer_cache_similarity,
+        ttl_seconds=retriever_config.answer_cache_ttl_seconds,
+        version_path=collection_version_path(retriever_config.collection_name),
+    )
+
+
+def setup_responder(input_config: dict, retrieval: RetrievalService) -> GeminiResponder:
     """Initialize the responder."""
     responder_config = input_config["responder_model"]
     responder_config = ResponderConfig.load(responder_config)
@@ -98,7 +229,11 @@ def setup_responder(input_config: dict) -> GeminiResponder:
         model=responder_config.model.model_id,
         system_instruction=responder_config.system_prompt,
     )
-    return GeminiResponder(client=gemini_provider, responder_config=responder_config)
+    return GeminiResponder(
+        client=gemini_provider,
+        responder_config=responder_config,
+        retrieval=retrieval,
+    )
 
 
 def create_app() -> FastAPI:
@@ -109,14 +244,19 @@ def create_app() -> FastAPI:
       1. Creates a new FastAPI instance with optional CORS middleware.
       2. Loads configuration.
       3. Sets up the Gemini Router, Qdrant Retriever, and Gemini Responder.
-      4. Loads RAG data and (re)generates the Qdrant collection.
+      4. Loads RAG data and synchronizes the Qdrant collection.
       5. Initializes a ChatRouter that wraps the RAG pipeline.
       6. Registers the chat endpoint under the /chat prefix.
 
     Returns:
         FastAPI: The configured FastAPI application instance.
     """
-    app = FastAPI(title="RAG Knowledge API", version="1.0", redirect_slashes=False)
+    app = FastAPI(
+        title="RAG Knowledge API",
+        version="1.0",
+        redirect_slashes=False,
+        lifespan=lifespan,
+    )
 
     # Configure CORS middleware
     app.add_middleware(
@@ -131,28 +271,35 @@ def create_app() -> FastAPI:
     input_config = load_json(settings.input_path / "input_parameters.json")
 
     # ✅ Load & Preprocess RAG Data Before Qdrant
-    df_docs = pd.read_csv(settings.data_path / "docs.csv", delimiter=",")
-    logger.info("Loaded CSV Data.", num_rows=len(df_docs))
+    docs_path = settings.data_path / "docs.csv"
 
     # ✅ Initialize Qdrant
     qdrant_client = setup_qdrant(input_config)
 
     # ✅ Setup Retriever with Preprocessed Data & External Data
-    retriever_component = setup_retriever(qdrant_client, input_config, df_docs)
+    retriever_component = setup_retriever(qdrant_client, input_config, docs_path)
+    app.state.embedding_cache = retriever_component.embedding_client.cache
+
+    # The chat endpoint searches asynchronously so it never blocks the event loop
+    async_retriever = setup_async_retriever(input_config, retriever_component)
+
+    # One retrieval service, shared by the router and the responder
+    retrieval = RetrievalService(retriever_component)
 
     # ✅ Setup Router & Responder
-    base_ai, router_component = setup_router(input_config)
-    responder_component = setup_responder(input_config)
+    base_ai, router_component = setup_router(input_config, retrieval)
+    responder_component = setup_responder(input_config, retrieval)
 
     # ✅ Initialize Chat Router
     chat_router = ChatRouter(
         router=APIRouter(),
         ai=base_ai,
         query_router=router_component,
-        retriever=retriever_component,
+        retriever=async_retriever,
         responder=responder_component,
         attestation=Vtpm(simulate=settings.simulate_attestation),
         prompts=PromptService(),
+        answer_cache=setup_answer_cache(input_config),
     )
     app.include_router(chat_router.router, prefix="/api/routes/chat", tags=["chat"])
 
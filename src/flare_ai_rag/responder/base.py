@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
 
+from flare_ai_rag.retriever import PipelineContext
+
 
 class BaseResponder(ABC):
     @abstractmethod
-    def generate_response(self, query: str, retrieved_documents: list[dict]) -> str:
+    def generate_response(
+        self,
+        query: str,
+        retrieved_documents: list[dict],
+        pipeline_context: PipelineContext | None = None,
+    ) -> str:
         """
         Generate a final answer given the query and a list of retrieved documents.
+
+        With a `pipeline_context`, the retrieved documents are the request's single
+        search and no additional retrieval is made.
         """
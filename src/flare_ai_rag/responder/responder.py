@@ -1,44 +1,62 @@
 from typing import Any, override
 
+import structlog
+
 from flare_ai_rag.ai import GeminiProvider, OpenRouterClient
 from flare_ai_rag.responder import BaseResponder, ResponderConfig
 from flare_ai_rag.utils import parse_chat_response
-from flare_ai_rag.retriever.qdrant_retriever import search_relevant_documents  # Import retrieval function
+from flare_ai_rag.retriever import PipelineContext, RetrievalService
+
+logger = structlog.get_logger(__name__)
 
 
 class GeminiResponder(BaseResponder):
     def __init__(
-        self, client: GeminiProvider, responder_config: ResponderConfig
+        self,
+        client: GeminiProvider,
+        responder_config: ResponderConfig,
+        retrieval: RetrievalService | None = None,
     ) -> None:
         """
         Initialize the responder with a GeminiProvider.
 
         :param client: An instance of GeminiProvider.
         :param responder_config: Configuration settings for AI responses.
+        :param retrieval: Shared retrieval service supplying additional context.
         """
         self.client = client
         self.responder_config = responder_config
+        self.retrieval = retrieval
 
     @override
-    def generate_response(self, query: str, retrieved_documents: list[dict]) -> str:
+    def generate_response(
+        self,
+        query: str,
+        retrieved_documents: list[dict],
+        pipeline_context: PipelineContext | None = None,
+    ) -> str:
         """
         Generate a final answer using the query, retrieved context, and real-world data.
         Dynamically adjusts retrieval size, includes citations, and handles unclear responses.
 
         :param query: The input query.
         :param retrieved_documents: A list of dictionaries containing retrieved docs.
+        :param pipeline_context: Request context; when given, no additional search
+            is made.
         :return: The generated answer as a string.
         """
         # Retrieve additional context from BigQuery & Flare
-        external_data = search_relevant_documents(query, top_k=5)["extra_data"]
-
-        # Dynamically adjust the number of retrieved documents
-        num_docs = min(len(retrieved_documents), 8) if len(query) > 100 else min(len(retrieved_documents), 5)
+        external_data = (
+            self.retrieval.search(query, top_k=5)
+            if self.retrieval and pipeline_context is None
+            else []
+        )
 
         context = "📚 List of retrieved documents:\n"
         citations = []
 
-        for idx, doc in enumerate(retrieved_documents[:num_docs], start=1):
+        # The retriever already sized the list (score threshold + adaptive top_k)
+        for idx, doc in enumerate(retrieved_documents, start=1):
             title = doc.get("title", f"Document {idx}")
             author = doc.get("author", "Unknown Author")
             date = doc.get("date", "Unknown Date")
@@ -70,9 +88,11 @@ class GeminiResponder(BaseResponder):
         # Detect unclear responses and refine using external data
         unclear_responses = ["I'm not sure", "I don't know", "Sorry", "I cannot find"]
         if any(phrase.lower() in response.text.lower() for phrase in unclear_responses) or len(response.text) < 30:
-            print("🔄 Low-confidence response detected. Refining answer with more retrieval...")
+            logger.info("Low-confidence response detected, refining answer", query=query)
             refined_query = f"Provide more details about: {query}"
-            return self.generate_response(refined_query, retrieved_documents)
+            return self.generate_response(
+                refined_query, retrieved_documents, pipeline_context
+            )
 
         # Append citations to response
         return response.text + "\n\n📚 Sources: " + ", ".join(citations)
@@ -80,29 +100,45 @@ class GeminiResponder(BaseResponder):
 
 class OpenRouterResponder(BaseResponder):
     def __init__(
-        self, client: OpenRouterClient, responder_config: ResponderConfig
+        self,
+        client: OpenRouterClient,
+        responder_config: ResponderConfig,
+        retrieval: RetrievalService | None = None,
     ) -> None:
         """
         Initialize the responder with an OpenRouter client and the model to use.
 
         :param client: An instance of OpenRouterClient.
         :param responder_config: Configuration settings for AI responses.
+        :param retrieval: Shared retrieval service supplying additional context.
         """
         self.client = client
         self.responder_config = responder_config
+        self.retrieval = retrieval
 
     @override
-    def generate_response(self, query: str, retrieved_documents: list[dict]) -> str:
+    def generate_response(
+        self,
+        query: str,
+        retrieved_documents: list[dict],
+        pipeline_context: PipelineContext | None = None,
+    ) -> str:
         """
         Generate a final answer using the query, retrieved documents, and additional knowledge.
         Dynamically adjusts retrieval and citation inclusion.
 
         :param query: The input query.
         :param retrieved_documents: A list of dictionaries containing retrieved docs.
+        :param pipeline_context: Request context; when given, no additional search
+            is made.
         :return: The generated answer as a string.
         """
         # Retrieve external data (BigQuery & Flare)
-        external_data = search_relevant_documents(query, top_k=5)["extra_data"]
+        external_data = (
+            self.retrieval.search(query, top_k=5)
+            if self.retrieval and pipeline_context is None
+            else []
+        )
 
         context = "📚 List of retrieved preprocessed documents:\n"
         citations = []
@@ -1,6 +1,48 @@
-from .base import BaseRetriever
+from .answer_cache import SemanticAnswerCache
+from .async_qdrant_retriever import AsyncQdrantRetriever
+from .base import AsyncBaseRetriever, AsyncRetrieverAdapter, BaseRetriever
+from .bm25 import BM25Index, reciprocal_rank_fusion
+from .client import create_async_qdrant_client, create_qdrant_client
 from .config import RetrieverConfig
-from .qdrant_collection import generate_collection
+from .context import PipelineContext
+from .filters import SearchFilters, build_filter
+from .mmr import mmr_select
+from .numpy_index import NumpyVectorIndex
+from .numpy_retriever import NumpyRetriever
+from .qdrant_collection import (
+    bm25_index_path,
+    collection_version_path,
+    generate_collection,
+    read_collection_version,
+    vector_index_path,
+)
 from .qdrant_retriever import QdrantRetriever
+from .query_cache import QueryVectorCache
+from .service import RetrievalService
 
-__all__ = ["BaseRetriever", "QdrantRetriever", "RetrieverConfig", "generate_collection"]
+__all__ = [
+    "AsyncBaseRetriever",
+    "AsyncQdrantRetriever",
+    "AsyncRetrieverAdapter",
+    "BM25Index",
+    "BaseRetriever",
+    "NumpyRetriever",
+    "NumpyVectorIndex",
+    "PipelineContext",
+    "QdrantRetriever",
+    "QueryVectorCache",
+    "RetrievalService",
+    "RetrieverConfig",
+    "SearchFilters",
+    "SemanticAnswerCache",
+    "bm25_index_path",
+    "build_filter",
+    "collection_version_path",
+    "create_async_qdrant_client",
+    "create_qdrant_client",
+    "generate_collection",
+    "mmr_select",
+    "read_collection_version",
+    "reciprocal_rank_fusion",
+    "vector_index_path",
+]
@@ -0,0 +1,168 @@
+"""
+Semantic Answer Cache Module
+
+This module implements an in-process cache of final answers keyed on query
+embeddings. Paraphrases of a popular question land close to each other in the
+embedding space, so a new query whose vector is similar enough to a cached one is
+answered without routing, retrieval or generation. The cached query vectors form
+a small matrix that is scanned with one matrix-vector product per lookup.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import numpy as np
+import structlog
+
+from flare_ai_rag.retriever.numpy_index import normalize_rows
+
+logger = structlog.get_logger(__name__)
+
+
+class SemanticAnswerCache:
+    """
+    Thread-safe cache of answers looked up by cosine similarity of query vectors.
+
+    Entries expire after a TTL, and the oldest entry is overwritten once the cache
+    is full. Every entry is tied to the collection version it was answered from:
+    when the version file written by `generate_collection` changes, e.g. because
+    another process synchronized the collection again, or when
+    `set_collection_version` is called with a new version, the whole cache is
+    dropped. Lookups only stat the version file and read it when it was modified.
+
+    Attributes:
+        max_entries (int): Maximum number of cached answers.
+        similarity_threshold (float): Minimum cosine similarity for a hit.
+        ttl_seconds (float): Lifetime of an entry; 0 or less disables expiry.
+        collection_version (str | None): Version the cached answers belong to.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups without a close enough entry.
+        invalidations (int): Number of times the cache was dropped because the
+            collection version changed.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        vector_size: int,
+        max_entries: int = 512,
+        similarity_threshold: float = 0.95,
+        ttl_seconds: float = 900.0,
+        *,
+        version_path: Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.collection_version: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._version_path = version_path
+        self._version_mtime: int | None = None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._vectors = np.zeros((self.max_entries, vector_size), dtype=np.float32)
+        self._stored_at = np.zeros(self.max_entries, dtype=np.float64)
+        self._valid = np.zeros(self.max_entries, dtype=bool)
+        self._answers: list[str | None] = [None] * self.max_entries
+        self._next = 0
+        self._check_version()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return int(self._valid.sum())
+
+    def get(self, query_vector: Sequence[float]) -> str | None:
+        """Return the answer of the most similar fresh entry, or None on a miss."""
+        self._check_version()
+        query = normalize_rows(np.atleast_2d(query_vector))[0]
+        with self._lock:
+            live = self._valid
+            if self.ttl_seconds > 0:
+                live = live & (self._clock() - self._stored_at <= self.ttl_seconds)
+            if not live.any():
+                self.misses += 1
+                return None
+            similarities = np.where(live, self._vectors @ query, -np.inf)
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                self.misses += 1
+                return None
+            self.hits += 1
+            logger.debug(
+                "Answer served from cache.",
+                similarity=round(float(similarities[best]), 4),
+                hit_rate=round(self.hit_rate, 3),
+            )
+            return self._answers[best]
+
+    def put(self, query_vector: Sequence[float], answer: str) -> None:
+        """Cache the answer to a query, overwriting the oldest entry if full."""
+        query = normalize_rows(np.atleast_2d(query_vector))[0]
+        with self._lock:
+            slot = self._next
+            self._vectors[slot] = query
+            self._stored_at[slot] = self._clock()
+            self._answers[slot] = answer
+            self._valid[slot] = True
+            self._next = (slot + 1) % self.max_entries
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters."""
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> dict[str, float]:
+        """Return the cache counters, e.g. for logging or a metrics endpoint."""
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hit_rate,
+        }
+
+    def set_collection_version(self, version: str | None) -> None:
+        """
+        Record the version of the synchronized collection, dropping every entry
+        if it changed since they were cached.
+        """
+        with self._lock:
+            if version == self.collection_version:
+                return
+            if self._valid.any():
+                self.invalidations += 1
+                logger.info(
+                    "Collection changed, answer cache invalidated.",
+                    previous=self.collection_version,
+                    current=version,
+                )
+            self._clear()
+            self.collection_version = version
+
+    def _check_version(self) -> None:
+        """Drop every entry if the version file changed since the last check."""
+        if self._version_path is None:
+            return
+        try:
+            mtime = self._version_path.stat().st_mtime_ns
+            if mtime == self._version_mtime:
+                return
+            version = self._version_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            mtime, version = None, None
+        self._version_mtime = mtime
+        self.set_collection_version(version)
+
+    def _clear(self) -> None:
+        self._valid[:] = False
+        self._answers = [None] * self.max_entries
+        self._next = 0
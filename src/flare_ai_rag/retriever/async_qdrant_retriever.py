@@ -0,0 +1,153 @@
+from collections.abc import Sequence
+from typing import Any, override
+
+import structlog
+from qdrant_client import AsyncQdrantClient
+
+from flare_ai_rag.ai import EmbeddingTaskType, GeminiEmbedding
+from flare_ai_rag.retriever.base import AsyncBaseRetriever
+from flare_ai_rag.retriever.bm25 import BM25Index
+from flare_ai_rag.retriever.config import RetrieverConfig
+from flare_ai_rag.retriever.filters import SearchFilters
+from flare_ai_rag.retriever.qdrant_retriever import (
+    QdrantSearchMixin,
+    cached_query_vectors,
+    missing_query_batches,
+    payload_fields,
+    store_query_vectors,
+)
+from flare_ai_rag.retriever.query_cache import QueryVectorCache
+
+logger = structlog.get_logger(__name__)
+
+
+class AsyncQdrantRetriever(QdrantSearchMixin, AsyncBaseRetriever):
+    def __init__(
+        self,
+        client: AsyncQdrantClient,
+        retriever_config: RetrieverConfig,
+        embedding_client: GeminiEmbedding,
+        query_cache: QueryVectorCache | None = None,
+        bm25_index: BM25Index | None = None,
+    ) -> None:
+        """
+        Initialize the AsyncQdrantRetriever.
+
+        Both the query embedding and the Qdrant search are awaited, so a single
+        event loop can serve many concurrent searches. `query_cache` may be shared
+        with a synchronous `QdrantRetriever`. With a `bm25_index` and the "hybrid"
+        retrieval mode, dense hits are fused with a lexical ranking. A positive
+        `mmr_diversity` fetches `mmr_candidates` hits with their vectors and
+        keeps a diverse subset chosen with maximal marginal relevance.
+        """
+        super().__init__(retriever_config, query_cache, bm25_index)
+        self.client = client
+        self.embedding_client = embedding_client
+
+    @override
+    async def embed_query(self, query: str) -> list[float]:
+        """Embed a query, serving repeated queries from the query cache."""
+        cached = self._cached_query_vector(query)
+        if cached is not None:
+            return cached
+        query_vector = await self.embedding_client.embed_content_async(
+            embedding_model=self.retriever_config.embedding_model,
+            contents=query,
+            task_type=EmbeddingTaskType.RETRIEVAL_QUERY,
+        )
+        self._cache_query_vector(query, query_vector)
+        return query_vector
+
+    async def embed_queries(self, queries: Sequence[str]) -> list[list[float]]:
+        """Embed queries in batch requests, serving repeats from the query cache."""
+        model = self.retriever_config.embedding_model
+        vectors = cached_query_vectors(self.query_cache, model, queries)
+        for batch in missing_query_batches(vectors):
+            embeddings = await self.embedding_client.embed_contents_async(
+                embedding_model=model,
+                contents=[queries[i] for i in batch],
+                task_type=EmbeddingTaskType.RETRIEVAL_QUERY,
+            )
+            store_query_vectors(
+                vectors,
+                batch,
+                embeddings,
+                queries=queries,
+                query_cache=self.query_cache,
+                embedding_model=model,
+            )
+        return [vector for vector in vectors if vector is not None]
+
+    @override
+    async def semantic_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+        query_vector: list[float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Perform semantic search using preprocessed document chunks and Flare data.
+
+        `filters` restricts the search to points whose payload matches, e.g.
+        `{"dataset": "flare_data"}`; Qdrant applies it through payload indexes.
+        Hits scoring below `score_threshold` are dropped, and with `adaptive_top_k`
+        the result is cut at the first large score gap, returning between
+        `min_top_k` and `max(top_k, max_top_k)` documents.
+        """
+        if query_vector is None:
+            query_vector = await self.embed_query(query)
+        return (await self._search([query], [query_vector], top_k, filters))[0]
+
+    @override
+    async def semantic_search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search several queries with one batched embedding call and a single
+        Qdrant `search_batch` request.
+        """
+        if not queries:
+            return []
+        query_vectors = await self.embed_queries(queries)
+        return await self._search(queries, query_vectors, top_k, filters)
+
+    async def _search(
+        self,
+        queries: Sequence[str],
+        query_vectors: list[list[float]],
+        top_k: int,
+        filters: SearchFilters | None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search embedded queries with one `search_batch` request, then fetch the
+        payloads of lexical-only hits in a single call.
+        """
+        top_k = self._result_limit(top_k)
+        batch_results = await self.client.search_batch(
+            collection_name=self.retriever_config.collection_name,
+            requests=self._search_requests(query_vectors, top_k, filters),
+        )
+        batch_results = self._diversify(query_vectors, batch_results, top_k)
+        lexical, missing = self._lexical_rankings(queries, batch_results, top_k)
+        records = (
+            await self.client.retrieve(
+                collection_name=self.retriever_config.collection_name,
+                ids=missing,
+                with_payload=payload_fields(filters),
+                with_vectors=self.lexical_vectors,
+            )
+            if missing
+            else []
+        )
+        return self._to_documents(
+            query_vectors,
+            batch_results,
+            lexical,
+            records,
+            top_k=top_k,
+            filters=filters,
+        )
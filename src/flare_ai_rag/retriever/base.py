@@ -1,7 +1,99 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, override
+
+from flare_ai_rag.retriever.filters import SearchFilters
 
 
 class BaseRetriever(ABC):
     @abstractmethod
-    def semantic_search(self, query: str, top_k: int = 5) -> list[dict]:
-        """Perform semantic search using vector embeddings."""
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a query with the retriever's embedding model."""
+
+    @abstractmethod
+    def semantic_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+        query_vector: list[float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Perform semantic search using vector embeddings. A `query_vector` already
+        computed for `query` (see `embed_query`) skips the embedding call.
+        """
+
+    def semantic_search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Search several queries; backends override this to batch the work."""
+        return [self.semantic_search(query, top_k, filters) for query in queries]
+
+
+class AsyncBaseRetriever(ABC):
+    @abstractmethod
+    async def embed_query(self, query: str) -> list[float]:
+        """Embed a query without blocking the event loop."""
+
+    @abstractmethod
+    async def semantic_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+        query_vector: list[float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Perform semantic search without blocking the event loop. A `query_vector`
+        already computed for `query` (see `embed_query`) skips the embedding call.
+        """
+
+    async def semantic_search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Search several queries; backends override this to batch the work."""
+        return [await self.semantic_search(query, top_k, filters) for query in queries]
+
+
+class AsyncRetrieverAdapter(AsyncBaseRetriever):
+    """
+    Serves a synchronous retriever to async callers by running each call in a
+    worker thread, so backends without an async client never block the event loop.
+    """
+
+    def __init__(self, retriever: BaseRetriever) -> None:
+        self.retriever = retriever
+
+    @override
+    async def embed_query(self, query: str) -> list[float]:
+        return await asyncio.to_thread(self.retriever.embed_query, query)
+
+    @override
+    async def semantic_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+        query_vector: list[float] | None = None,
+    ) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(
+            self.retriever.semantic_search, query, top_k, filters, query_vector
+        )
+
+    @override
+    async def semantic_search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        return await asyncio.to_thread(
+            self.retriever.semantic_search_batch, queries, top_k, filters
+        )
@@ -0,0 +1,57 @@
+"""
+Qdrant Client Module
+
+This module builds Qdrant clients from `RetrieverConfig`. REST clients share a
+bounded pool of keep-alive HTTP connections, and gRPC clients keep a persistent
+channel alive with pings, so neither pays connection setup on every request.
+"""
+
+from typing import Any
+
+import httpx
+from qdrant_client import AsyncQdrantClient, QdrantClient
+
+from flare_ai_rag.retriever.config import RetrieverConfig
+
+
+def qdrant_client_options(retriever_config: RetrieverConfig) -> dict[str, Any]:
+    """
+    Translate the transport settings of a `RetrieverConfig` into client kwargs.
+
+    Args:
+        retriever_config (RetrieverConfig): The retriever configuration.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for `QdrantClient`/`AsyncQdrantClient`.
+    """
+    keepalive_ms = int(retriever_config.keepalive_seconds * 1000)
+    return {
+        "host": retriever_config.host,
+        "port": retriever_config.port,
+        "grpc_port": retriever_config.grpc_port,
+        "prefer_grpc": retriever_config.prefer_grpc,
+        "timeout": retriever_config.timeout_seconds,
+        # REST: reuse up to `pool_size` connections instead of reconnecting.
+        "limits": httpx.Limits(
+            max_connections=retriever_config.pool_size,
+            max_keepalive_connections=retriever_config.pool_size,
+            keepalive_expiry=retriever_config.keepalive_seconds,
+        ),
+        # gRPC: ping idle channels so they are not dropped between requests.
+        "grpc_options": {
+            "grpc.keepalive_time_ms": keepalive_ms,
+            "grpc.keepalive_timeout_ms": min(keepalive_ms, 10_000),
+            "grpc.keepalive_permit_without_calls": 1,
+            "grpc.http2.max_pings_without_data": 0,
+        },
+    }
+
+
+def create_qdrant_client(retriever_config: RetrieverConfig) -> QdrantClient:
+    """Create a Qdrant client using the configured transport and pooling."""
+    return QdrantClient(**qdrant_client_options(retriever_config))
+
+
+def create_async_qdrant_client(retriever_config: RetrieverConfig) -> AsyncQdrantClient:
+    """Create an async Qdrant client using the configured transport and pooling."""
+    return AsyncQdrantClient(**qdrant_client_options(retriever_config))
@@ -11,6 +11,45 @@ class RetrieverConfig:
     vector_size: int
     host: str
     port: int
+    backend: str = "qdrant"
+    grpc_port: int = 6334
+    prefer_grpc: bool = False
+    pool_size: int = 16
+    timeout_seconds: int | None = None
+    keepalive_seconds: float = 30.0
+    embedding_batch_size: int = 100
+    embedding_concurrency: int = 4
+    embedding_max_retries: int = 5
+    embedding_cache_max_entries: int = 100_000
+    sync_mode: str = "incremental"
+    upsert_batch_size: int = 256
+    upsert_parallelism: int = 2
+    csv_chunk_size: int = 256
+    query_cache_max_entries: int = 1024
+    query_cache_ttl_seconds: float = 3600.0
+    retrieval_mode: str = "dense"
+    hybrid_candidates: int = 20
+    rrf_k: int = 60
+    quantization: str = "none"
+    quantization_always_ram: bool = True
+    oversampling: float = 2.0
+    rescore: bool = True
+    on_disk_vectors: bool = False
+    on_disk_payload: bool = False
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    hnsw_ef: int | None = None
+    mmr_diversity: float = 0.0
+    mmr_candidates: int = 20
+    text_window: int | None = None
+    score_threshold: float | None = None
+    adaptive_top_k: bool = False
+    min_top_k: int = 1
+    max_top_k: int = 8
+    score_gap: float = 0.15
+    answer_cache_max_entries: int = 0
+    answer_cache_similarity: float = 0.95
+    answer_cache_ttl_seconds: float = 900.0
 
     @staticmethod
     def load(retriever_config: dict[str, Any]) -> "RetrieverConfig":
@@ -20,4 +59,57 @@ class RetrieverConfig:
             vector_size=retriever_config["vector_size"],
             host=retriever_config["host"],
             port=retriever_config["port"],
+            backend=retriever_config.get("backend", "qdrant"),
+            grpc_port=retriever_config.get("grpc_port", 6334),
+            prefer_grpc=retriever_config.get("prefer_grpc", False),
+            pool_size=retriever_config.get("pool_size", 16),
+            timeout_seconds=retriever_config.get("timeout_seconds"),
+            keepalive_seconds=retriever_config.get("keepalive_seconds", 30.0),
+            embedding_batch_size=retriever_config.get("embedding_batch_size", 100),
+            embedding_concurrency=retriever_config.get("embedding_concurrency", 4),
+            embedding_max_retries=retriever_config.get("embedding_max_retries", 5),
+            embedding_cache_max_entries=retriever_config.get(
+                "embedding_cache_max_entries", 100_000
+            ),
+            sync_mode=retriever_config.get("sync_mode", "incremental"),
+            upsert_batch_size=retriever_config.get("upsert_batch_size", 256),
+            upsert_parallelism=retriever_config.get("upsert_parallelism", 2),
+            csv_chunk_size=retriever_config.get("csv_chunk_size", 256),
+            query_cache_max_entries=retriever_config.get(
+                "query_cache_max_entries", 1024
+            ),
+            query_cache_ttl_seconds=retriever_config.get(
+                "query_cache_ttl_seconds", 3600.0
+            ),
+            retrieval_mode=retriever_config.get("retrieval_mode", "dense"),
+            hybrid_candidates=retriever_config.get("hybrid_candidates", 20),
+            rrf_k=retriever_config.get("rrf_k", 60),
+            quantization=retriever_config.get("quantization", "none"),
+            quantization_always_ram=retriever_config.get(
+                "quantization_always_ram", True
+            ),
+            oversampling=retriever_config.get("oversampling", 2.0),
+            rescore=retriever_config.get("rescore", True),
+            on_disk_vectors=retriever_config.get("on_disk_vectors", False),
+            on_disk_payload=retriever_config.get("on_disk_payload", False),
+            hnsw_m=retriever_config.get("hnsw_m", 16),
+            hnsw_ef_construct=retriever_config.get("hnsw_ef_construct", 100),
+            hnsw_ef=retriever_config.get("hnsw_ef"),
+            mmr_diversity=retriever_config.get("mmr_diversity", 0.0),
+            mmr_candidates=retriever_config.get("mmr_candidates", 20),
+            text_window=retriever_config.get("text_window"),
+            score_threshold=retriever_config.get("score_threshold"),
+            adaptive_top_k=retriever_config.get("adaptive_top_k", False),
+            min_top_k=retriever_config.get("min_top_k", 1),
+            max_top_k=retriever_config.get("max_top_k", 8),
+            score_gap=retriever_config.get("score_gap", 0.15),
+            answer_cache_max_entries=retriever_config.get(
+                "answer_cache_max_entries", 0
+            ),
+            answer_cache_similarity=retriever_config.get(
+                "answer_cache_similarity", 0.95
+            ),
+            answer_cache_ttl_seconds=retriever_config.get(
+                "answer_cache_ttl_seconds", 900.0
+            ),
         )
@@ -0,0 +1,45 @@
+"""
+Pipeline Context Module
+
+This module defines the request-scoped state of one RAG chat request. The chat
+route, the query router and the responder all need the same retrieval results;
+carrying them in a context means each request embeds its query once and searches
+once, whichever stage asks first.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from flare_ai_rag.retriever.base import AsyncBaseRetriever
+
+
+@dataclass
+class PipelineContext:
+    """
+    Query vector and retrieved documents of a single request.
+
+    Attributes:
+        query (str): The user query.
+        query_vector (list[float] | None): Embedding of the query, once computed.
+        documents (list[dict[str, Any]] | None): Retrieved documents, once searched.
+    """
+
+    query: str
+    query_vector: list[float] | None = None
+    documents: list[dict[str, Any]] | None = None
+
+    async def embed(self, retriever: AsyncBaseRetriever) -> list[float]:
+        """Return the query vector, embedding the query on first use."""
+        if self.query_vector is None:
+            self.query_vector = await retriever.embed_query(self.query)
+        return self.query_vector
+
+    async def retrieve(
+        self, retriever: AsyncBaseRetriever, top_k: int = 5
+    ) -> list[dict[str, Any]]:
+        """Return the documents, searching with the query vector on first use."""
+        if self.documents is None:
+            self.documents = await retriever.semantic_search(
+                self.query, top_k=top_k, query_vector=await self.embed(retriever)
+            )
+        return self.documents
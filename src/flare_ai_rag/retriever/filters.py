@@ -0,0 +1,84 @@
+"""
+Search Filters Module
+
+This module turns the structured filters accepted by the retrievers into Qdrant
+filters and evaluates them against payloads for in-process backends. A filter
+maps a payload field to a value (exact match) or to a list of values (match any):
+
+    {"dataset": "flare_data"}
+    {"dataset": "docs", "filename": ["1-intro.mdx", "2-getting-started.mdx"]}
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from qdrant_client.http.models import (
+    FieldCondition,
+    Filter,
+    MatchAny,
+    MatchValue,
+    PayloadSchemaType,
+)
+
+SearchFilters = Mapping[str, Any]
+
+# Payload fields that get a Qdrant payload index, so filtered searches only visit
+# matching points instead of post-filtering the whole collection.
+INDEXED_PAYLOAD_FIELDS: dict[str, PayloadSchemaType] = {
+    "dataset": PayloadSchemaType.KEYWORD,
+    "filename": PayloadSchemaType.KEYWORD,
+    "document_id": PayloadSchemaType.KEYWORD,
+    "title": PayloadSchemaType.KEYWORD,
+    "author": PayloadSchemaType.KEYWORD,
+    "date": PayloadSchemaType.KEYWORD,
+}
+
+
+def _values(value: Any) -> list[Any] | None:
+    """Return the accepted values of a match-any condition, None for exact match."""
+    if isinstance(value, list | tuple | set | frozenset):
+        return list(value)
+    return None
+
+
+def build_filter(filters: SearchFilters | None) -> Filter | None:
+    """
+    Convert structured filters into a Qdrant filter.
+
+    Args:
+        filters (SearchFilters | None): Payload field -> value or list of values.
+
+    Returns:
+        Filter | None: A filter requiring every condition, or None without filters.
+    """
+    if not filters:
+        return None
+    conditions = []
+    for key, value in filters.items():
+        values = _values(value)
+        match = MatchAny(any=values) if values is not None else MatchValue(value=value)
+        conditions.append(FieldCondition(key=key, match=match))
+    return Filter(must=conditions)
+
+
+def payload_matches(payload: Mapping[str, Any], filters: SearchFilters | None) -> bool:
+    """
+    Check whether a payload satisfies structured filters.
+
+    Args:
+        payload (Mapping[str, Any]): The point payload.
+        filters (SearchFilters | None): Payload field -> value or list of values.
+
+    Returns:
+        bool: True if every condition holds (always True without filters).
+    """
+    if not filters:
+        return True
+    for key, value in filters.items():
+        values = _values(value)
+        actual = payload.get(key)
+        if values is not None and actual not in values:
+            return False
+        if values is None and actual != value:
+            return False
+    return True
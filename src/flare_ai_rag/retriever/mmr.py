@@ -0,0 +1,61 @@
+"""
+Maximal Marginal Relevance Module
+
+This module diversifies a ranked candidate list with maximal marginal relevance
+(MMR). The top hits of a query are often near-identical chunks of the same page;
+MMR trades a little relevance for coverage by penalizing candidates that are
+similar to the ones already selected. All similarities come from two NumPy
+matrix products, and each selection step is a vectorized update.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from flare_ai_rag.retriever.numpy_index import normalize_rows
+
+
+def mmr_select(
+    query_vector: np.ndarray | Sequence[float],
+    candidate_vectors: np.ndarray | Sequence[Sequence[float]],
+    top_k: int,
+    diversity: float = 0.3,
+) -> list[int]:
+    """
+    Pick a relevant yet diverse subset of candidates.
+
+    Every step selects the candidate maximizing
+    `(1 - diversity) * sim(query, c) - diversity * max(sim(c, selected))`.
+
+    Args:
+        query_vector (np.ndarray | Sequence[float]): The query vector.
+        candidate_vectors (np.ndarray | Sequence[Sequence[float]]): A (n, d)
+            matrix of candidate vectors; they need not be normalized.
+        top_k (int): Number of candidates selected.
+        diversity (float): 0 keeps the relevance order, 1 maximizes diversity.
+
+    Returns:
+        list[int]: Indices of the selected candidates, in selection order; empty
+            when there are no candidates.
+    """
+    k = min(top_k, len(candidate_vectors))
+    if k <= 0:
+        return []
+    candidates = normalize_rows(np.atleast_2d(candidate_vectors))
+    query = normalize_rows(np.atleast_2d(query_vector))[0]
+    relevance = (1 - diversity) * (candidates @ query)
+    similarity = candidates @ candidates.T
+
+    first = int(np.argmax(relevance))
+    selected = [first]
+    # Similarity of every candidate to its closest already-selected candidate.
+    redundancy = similarity[first].copy()
+    available = np.ones(len(candidates), dtype=bool)
+    available[first] = False
+    while len(selected) < k:
+        scores = np.where(available, relevance - diversity * redundancy, -np.inf)
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        np.maximum(redundancy, similarity[best], out=redundancy)
+    return selected
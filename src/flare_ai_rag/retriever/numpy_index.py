@@ -0,0 +1,249 @@
+"""
+NumPy Vector Index Module
+
+This module implements an in-process exact vector index for corpora that fit in
+memory. Vectors are L2-normalized and stored as one float32 matrix that is
+memory-mapped on load, so cosine similarity becomes a single matrix product and
+top-k selection uses `np.argpartition` instead of a full sort.
+"""
+
+import json
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+from qdrant_client import QdrantClient
+
+logger = structlog.get_logger(__name__)
+
+VECTORS_FILE = "vectors.f32"
+PAYLOADS_FILE = "payloads.jsonl"
+META_FILE = "index.json"
+SCROLL_PAGE_SIZE = 1024
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row so dot products equal cosine similarities.
+
+    Args:
+        vectors (np.ndarray): A (n, d) matrix.
+
+    Returns:
+        np.ndarray: A float32 copy with unit-length rows (zero rows unchanged).
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class NumpyVectorIndex:
+    """
+    Exact cosine-similarity index over a memory-mapped float32 matrix.
+
+    Attributes:
+        vectors (np.ndarray): The (n, d) matrix of unit-length vectors.
+        ids (list[str]): Point ID of each row.
+        payloads (list[dict[str, Any]]): Payload of each row.
+    """
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        ids: Sequence[str],
+        payloads: Sequence[dict[str, Any]],
+    ) -> None:
+        if not len(vectors) == len(ids) == len(payloads):
+            msg = "vectors, ids and payloads must have the same length."
+            raise ValueError(msg)
+        self.vectors = vectors
+        self.ids = list(ids)
+        self.payloads = list(payloads)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def vector_size(self) -> int:
+        """Dimension of the indexed vectors."""
+        return self.vectors.shape[1]
+
+    @classmethod
+    def build(
+        cls,
+        folder: Path,
+        ids: Sequence[str],
+        vectors: np.ndarray | Sequence[Sequence[float]],
+        payloads: Sequence[dict[str, Any]],
+        version: str | None = None,
+    ) -> "NumpyVectorIndex":
+        """
+        Normalize vectors, write the index to `folder` and load it back.
+
+        Args:
+            folder (Path): Directory receiving the index files.
+            ids (Sequence[str]): Point ID of each vector.
+            vectors (np.ndarray | Sequence[Sequence[float]]): The vectors.
+            payloads (Sequence[dict[str, Any]]): Payload of each vector.
+            version (str | None): Version of the indexed data, recorded so an
+                unchanged index can be reused.
+
+        Returns:
+            NumpyVectorIndex: The index, memory-mapped from disk.
+        """
+        matrix = normalize_rows(
+            np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1)
+        )
+        folder.mkdir(parents=True, exist_ok=True)
+        matrix.tofile(folder / VECTORS_FILE)
+        with (folder / PAYLOADS_FILE).open("w", encoding="utf-8") as f:
+            for point_id, payload in zip(ids, payloads, strict=True):
+                f.write(
+                    json.dumps({"id": point_id, "payload": payload}, ensure_ascii=False)
+                )
+                f.write("\n")
+        meta = {"count": len(ids), "vector_size": matrix.shape[1], "version": version}
+        (folder / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+        return cls.load(folder)
+
+    @classmethod
+    def load(cls, folder: Path) -> "NumpyVectorIndex":
+        """
+        Load an index written by `build`, memory-mapping its vectors.
+
+        Args:
+            folder (Path): Directory holding the index files.
+
+        Returns:
+            NumpyVectorIndex: The loaded index.
+        """
+        meta = json.loads((folder / META_FILE).read_text(encoding="utf-8"))
+        shape = (meta["count"], meta["vector_size"])
+        vectors = (
+            np.memmap(folder / VECTORS_FILE, dtype=np.float32, mode="r", shape=shape)
+            if meta["count"]
+            else np.empty(shape, dtype=np.float32)
+        )
+        ids, payloads = [], []
+        with (folder / PAYLOADS_FILE).open(encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                ids.append(record["id"])
+                payloads.append(record["payload"])
+        logger.info("Vector index loaded.", path=str(folder), points=len(ids))
+        return cls(vectors, ids, payloads)
+
+    @staticmethod
+    def stored_version(folder: Path) -> str | None:
+        """
+        Return the version recorded by `build` in `folder`, if any.
+
+        Args:
+            folder (Path): Directory holding the index files.
+
+        Returns:
+            str | None: The recorded version, or None if there is no index.
+        """
+        try:
+            meta = json.loads((folder / META_FILE).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return meta.get("version")
+
+    @classmethod
+    def from_qdrant(
+        cls,
+        client: QdrantClient,
+        collection_name: str,
+        folder: Path,
+        version: str | None = None,
+    ) -> "NumpyVectorIndex":
+        """
+        Export a Qdrant collection, vectors and payloads, into a NumPy index.
+
+        When `version` is given and the index in `folder` was exported at that
+        version, it is loaded as is instead of scrolling the collection again.
+
+        Args:
+            client (QdrantClient): Client connected to the collection.
+            collection_name (str): Collection to export.
+            folder (Path): Directory receiving the index files.
+            version (str | None): Current version of the collection.
+
+        Returns:
+            NumpyVectorIndex: The exported index.
+        """
+        if version is not None and cls.stored_version(folder) == version:
+            return cls.load(folder)
+        ids, vectors, payloads = [], [], []
+        for point in _scroll_points(client, collection_name):
+            ids.append(str(point.id))
+            vectors.append(point.vector)
+            payloads.append(point.payload or {})
+        logger.info(
+            "Collection exported.", collection_name=collection_name, points=len(ids)
+        )
+        return cls.build(folder, ids, vectors, payloads, version=version)
+
+    def search(
+        self,
+        query_vectors: np.ndarray | Sequence[Sequence[float]],
+        top_k: int = 5,
+        rows: np.ndarray | None = None,
+    ) -> list[list[tuple[int, float]]]:
+        """
+        Find the rows most similar to each query vector.
+
+        All queries are scored with a single matrix product and the top rows of
+        every query are selected together with `np.argpartition`.
+
+        Args:
+            query_vectors (np.ndarray | Sequence[Sequence[float]]): A (b, d)
+                matrix of query vectors; they need not be normalized.
+            top_k (int): Number of rows returned per query.
+            rows (np.ndarray | None): Restrict the search to these rows, e.g.
+                the rows whose payload matches a filter.
+
+        Returns:
+            list[list[tuple[int, float]]]: For every query, (row, score) pairs
+                sorted by decreasing cosine similarity.
+        """
+        queries = normalize_rows(np.atleast_2d(query_vectors))
+        k = min(top_k, len(self) if rows is None else len(rows))
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        candidates = self.vectors if rows is None else self.vectors[rows]
+        scores = queries @ candidates.T  # (b, n)
+        if k < scores.shape[1]:
+            top = np.argpartition(scores, -k, axis=1)[:, -k:]
+        else:
+            top = np.broadcast_to(np.arange(scores.shape[1]), (len(queries), k))
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        if rows is not None:
+            top = rows[top]
+        return [
+            list(zip(rows.tolist(), row_scores.tolist(), strict=True))
+            for rows, row_scores in zip(top, top_scores, strict=True)
+        ]
+
+
+def _scroll_points(client: QdrantClient, collection_name: str) -> Iterator[Any]:
+    """Yield every point of a collection, with its vector and payload."""
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            limit=SCROLL_PAGE_SIZE,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True,
+        )
+        yield from points
+        if offset is None:
+            break
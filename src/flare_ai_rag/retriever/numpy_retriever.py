@@ -0,0 +1,150 @@
+from collections.abc import Sequence
+from typing import Any, override
+
+import numpy as np
+import structlog
+
+from flare_ai_rag.ai import GeminiEmbedding
+from flare_ai_rag.retriever.base import BaseRetriever
+from flare_ai_rag.retriever.config import RetrieverConfig
+from flare_ai_rag.retriever.filters import SearchFilters, payload_matches
+from flare_ai_rag.retriever.mmr import mmr_select
+from flare_ai_rag.retriever.numpy_index import NumpyVectorIndex
+from flare_ai_rag.retriever.qdrant_retriever import (
+    cut_documents,
+    embed_query_batch,
+    payload_to_document,
+)
+from flare_ai_rag.retriever.query_cache import QueryVectorCache
+
+logger = structlog.get_logger(__name__)
+
+
+class NumpyRetriever(BaseRetriever):
+    def __init__(
+        self,
+        index: NumpyVectorIndex,
+        retriever_config: RetrieverConfig,
+        embedding_client: GeminiEmbedding,
+        query_cache: QueryVectorCache | None = None,
+    ) -> None:
+        """
+        Initialize the NumpyRetriever.
+
+        Searches run in-process against `index`, so no vector database is needed;
+        only the query embeddings go over the network.
+        """
+        self.index = index
+        self.retriever_config = retriever_config
+        self.embedding_client = embedding_client
+        self.query_cache = query_cache
+
+    @override
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a query, serving repeated queries from the query cache."""
+        return self.embed_queries([query])[0]
+
+    def embed_queries(self, queries: Sequence[str]) -> list[list[float]]:
+        """Embed queries in batch requests, serving repeats from the query cache."""
+        return embed_query_batch(
+            self.embedding_client,
+            self.retriever_config.embedding_model,
+            queries,
+            self.query_cache,
+        )
+
+    @override
+    def semantic_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+        query_vector: list[float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Perform semantic search against the in-process vector index.
+        """
+        if query_vector is None:
+            query_vector = self.embed_query(query)
+        return self._search([query_vector], top_k, filters)[0]
+
+    @override
+    def semantic_search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search several queries at once: one embedding request per batch of
+        queries and a single matrix product for all of them. With a positive
+        `mmr_diversity`, the top `mmr_candidates` rows of each query are
+        diversified with maximal marginal relevance. Rows below `score_threshold`
+        are dropped and `adaptive_top_k` cuts each result at its first large
+        score gap.
+
+        Args:
+            queries (Sequence[str]): The queries to search for.
+            top_k (int): Number of documents returned per query.
+            filters (SearchFilters | None): Only rows whose payload matches are
+                searched.
+
+        Returns:
+            list[list[dict[str, Any]]]: The retrieved documents of each query,
+                in query order.
+        """
+        if not queries:
+            return []
+        return self._search(self.embed_queries(queries), top_k, filters)
+
+    def _search(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filters: SearchFilters | None,
+    ) -> list[list[dict[str, Any]]]:
+        """Search the index with already embedded queries."""
+        rows = None
+        if filters:
+            rows = np.flatnonzero(
+                [payload_matches(payload, filters) for payload in self.index.payloads]
+            )
+        config = self.retriever_config
+        if config.adaptive_top_k:
+            top_k = max(top_k, config.max_top_k)
+        diversity = config.mmr_diversity
+        fetch_k = top_k
+        if diversity > 0:
+            fetch_k = max(top_k, config.mmr_candidates)
+        batch_hits = self.index.search(query_vectors, top_k=fetch_k, rows=rows)
+        if config.score_threshold is not None:
+            batch_hits = [
+                [(row, score) for row, score in hits if score >= config.score_threshold]
+                for hits in batch_hits
+            ]
+        if diversity > 0:
+            # Index vectors are already unit-length; MMR picks among the candidates.
+            batch_hits = [
+                [
+                    hits[i]
+                    for i in mmr_select(
+                        query_vector,
+                        self.index.vectors[[row for row, _ in hits]],
+                        top_k,
+                        diversity,
+                    )
+                ]
+                for query_vector, hits in zip(query_vectors, batch_hits, strict=True)
+            ]
+        return [
+            cut_documents(
+                [
+                    payload_to_document(
+                        self.index.payloads[row], score, config.text_window
+                    )
+                    for row, score in hits
+                ],
+                config,
+            )
+            for hits in batch_hits
+        ]
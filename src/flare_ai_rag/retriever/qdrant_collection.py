@@ -1,12 +1,50 @@
-import google.api_core.exceptions
+import hashlib
+import itertools
+import uuid
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+import numpy as np
 import pandas as pd
 import structlog
 import os
 import json
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, PointStruct, VectorParams
-from flare_ai_rag.ai import EmbeddingTaskType, GeminiEmbedding
+from qdrant_client.http.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    CollectionConfig,
+    CollectionParamsDiff,
+    Disabled,
+    Distance,
+    ExtendedPointId,
+    HnswConfigDiff,
+    PointIdsList,
+    PointStruct,
+    QuantizationConfig,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+    VectorParamsDiff,
+)
+from flare_ai_rag.ai import (
+    BatchEmbeddingEngine,
+    EmbeddingItem,
+    EmbeddingTaskType,
+    GeminiEmbedding,
+    content_hash,
+)
+from flare_ai_rag.data_preprocessing.chunk_store import (
+    chunk_store_exists,
+    iter_chunk_store,
+)
+from flare_ai_rag.retriever.bm25 import BM25Builder
 from flare_ai_rag.retriever.config import RetrieverConfig
+from flare_ai_rag.retriever.filters import INDEXED_PAYLOAD_FIELDS
 
 # ✅ Ensure Structlog is Configured
 structlog.configure(
@@ -17,112 +55,556 @@ structlog.configure(
 logger = structlog.get_logger(__name__)
 
 PROCESSED_DIR = "processed_data/"  # Folder where preprocessed & external data is stored
+SCROLL_PAGE_SIZE = 1024
+MIN_TEXT_LENGTH = 10  # Shorter texts are skipped rather than embedded
+
+# Namespace of the UUIDv5 point IDs; changing it re-keys every stored point.
+POINT_ID_NAMESPACE = uuid.UUID("9b2f4c1e-5d0a-4c57-9a3e-6f1b8d2e7c40")
+
+
+def _quantization_config(
+    retriever_config: RetrieverConfig,
+) -> ScalarQuantization | BinaryQuantization | None:
+    """
+    Build the Qdrant quantization config selected by `retriever_config.quantization`.
+
+    "scalar" stores int8 copies of the vectors (4x smaller), "binary" stores one
+    bit per dimension (32x smaller); "none" keeps only the float32 vectors.
+    """
+    mode = retriever_config.quantization
+    always_ram = retriever_config.quantization_always_ram
+    if mode == "none":
+        return None
+    if mode == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8, quantile=0.99, always_ram=always_ram
+            )
+        )
+    if mode == "binary":
+        return BinaryQuantization(
+            binary=BinaryQuantizationConfig(always_ram=always_ram)
+        )
+    msg = f"Unknown quantization mode: {mode}"
+    raise ValueError(msg)
+
+
+def _same_quantization(
+    current: QuantizationConfig | None,
+    wanted: ScalarQuantization | BinaryQuantization | None,
+) -> bool:
+    """
+    Compare the stored quantization config with the configured one field by field.
 
-def _create_collection(client: QdrantClient, collection_name: str, vector_size: int) -> None:
+    Over gRPC the quantile comes back as a float32 (0.99 reads as
+    0.9900000095367432), so it is compared at that precision.
     """
-    Creates a Qdrant collection with the given parameters.
+    if isinstance(current, ScalarQuantization) and isinstance(
+        wanted, ScalarQuantization
+    ):
+        stored, scalar = current.scalar, wanted.scalar
+        return (
+            stored.type == scalar.type
+            and bool(stored.always_ram) == bool(scalar.always_ram)
+            and _as_float32(stored.quantile) == _as_float32(scalar.quantile)
+        )
+    if isinstance(current, BinaryQuantization) and isinstance(
+        wanted, BinaryQuantization
+    ):
+        return bool(current.binary.always_ram) == bool(wanted.binary.always_ram)
+    return current is None and wanted is None
+
+
+def _as_float32(value: float | None) -> float | None:
+    return None if value is None else float(np.float32(value))
+
+
+def _create_collection(client: QdrantClient, retriever_config: RetrieverConfig) -> None:
+    """
+    Creates a Qdrant collection with the configured vector, HNSW, quantization and
+    on-disk storage settings.
     """
     client.recreate_collection(
-        collection_name=collection_name,
-        vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
+        collection_name=retriever_config.collection_name,
+        vectors_config=VectorParams(
+            size=retriever_config.vector_size,
+            distance=Distance.COSINE,
+            on_disk=retriever_config.on_disk_vectors,
+        ),
+        hnsw_config=HnswConfigDiff(
+            m=retriever_config.hnsw_m, ef_construct=retriever_config.hnsw_ef_construct
+        ),
+        quantization_config=_quantization_config(retriever_config),
+        on_disk_payload=retriever_config.on_disk_payload,
+    )
+
+
+def _ensure_collection(client: QdrantClient, retriever_config: RetrieverConfig) -> None:
+    """
+    Creates the Qdrant collection unless a compatible one already exists.
+
+    An existing collection with the right vector size keeps its points; storage,
+    HNSW and quantization settings that drifted from the config are updated in
+    place, which only triggers an index rebuild when something actually changed.
+    """
+    collection_name = retriever_config.collection_name
+    if client.collection_exists(collection_name):
+        config = client.get_collection(collection_name).config
+        vectors = config.params.vectors
+        if (
+            isinstance(vectors, VectorParams)
+            and vectors.size == retriever_config.vector_size
+            and vectors.distance == Distance.COSINE
+        ):
+            # Embedded Qdrant ignores storage, HNSW and quantization settings.
+            if not _is_embedded(client):
+                _update_collection_settings(client, retriever_config, config)
+            return
+        logger.warning(
+            "Existing collection is incompatible, recreating it.",
+            collection_name=collection_name,
+        )
+    _create_collection(client, retriever_config)
+
+
+def _is_embedded(client: QdrantClient) -> bool:
+    """Whether `client` runs Qdrant in-process (":memory:" or a local path)."""
+    options = client.init_options
+    return options.get("location") == ":memory:" or options.get("path") is not None
+
+
+def _update_collection_settings(
+    client: QdrantClient, retriever_config: RetrieverConfig, config: CollectionConfig
+) -> None:
+    """Apply the configured storage settings that differ from `config`."""
+    vectors = config.params.vectors
+    quantization = _quantization_config(retriever_config)
+    changes: dict[str, Any] = {}
+    if (
+        isinstance(vectors, VectorParams)
+        and bool(vectors.on_disk) != retriever_config.on_disk_vectors
+    ):
+        changes["vectors_config"] = {
+            "": VectorParamsDiff(on_disk=retriever_config.on_disk_vectors)
+        }
+    if bool(config.params.on_disk_payload) != retriever_config.on_disk_payload:
+        changes["collection_params"] = CollectionParamsDiff(
+            on_disk_payload=retriever_config.on_disk_payload
+        )
+    if (config.hnsw_config.m, config.hnsw_config.ef_construct) != (
+        retriever_config.hnsw_m,
+        retriever_config.hnsw_ef_construct,
+    ):
+        changes["hnsw_config"] = HnswConfigDiff(
+            m=retriever_config.hnsw_m, ef_construct=retriever_config.hnsw_ef_construct
+        )
+    if not _same_quantization(config.quantization_config, quantization):
+        changes["quantization_config"] = quantization or Disabled.DISABLED
+    if changes:
+        logger.info(
+            "Updating collection settings.",
+            collection_name=retriever_config.collection_name,
+            settings=sorted(changes),
+        )
+        client.update_collection(
+            collection_name=retriever_config.collection_name, **changes
+        )
+
+
+def _ensure_payload_indexes(client: QdrantClient, collection_name: str) -> None:
+    """
+    Creates the payload indexes used by filtered search, skipping existing ones.
+    """
+    existing = client.get_collection(collection_name).payload_schema or {}
+    for field_name, field_schema in INDEXED_PAYLOAD_FIELDS.items():
+        if field_name not in existing:
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=field_schema,
+            )
+
+
+def _stored_hashes(
+    client: QdrantClient, collection_name: str
+) -> dict[ExtendedPointId, str | None]:
+    """
+    Returns the content hash stored with every point of the collection.
+    """
+    hashes: dict[ExtendedPointId, str | None] = {}
+    offset = None
+    while True:
+        records, offset = client.scroll(
+            collection_name=collection_name,
+            limit=SCROLL_PAGE_SIZE,
+            offset=offset,
+            with_payload=["content_hash"],
+            with_vectors=False,
+        )
+        for record in records:
+            hashes[record.id] = (record.payload or {}).get("content_hash")
+        if offset is None:
+            return hashes
+
+
+def point_id(dataset: str, source: str, chunk_index: int = 0) -> str:
+    """
+    Returns the stable ID of a point, derived from its source-namespaced key.
+    The same chunk of the same source always maps to the same ID, across runs and
+    independently of whatever else is being indexed.
+    """
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{dataset}/{source}/{chunk_index}"))
+
+
+def _point_hash(embedding_model: str, item: EmbeddingItem, payload: dict) -> str:
+    """
+    Hashes everything that ends up in a point: the embedding input and the payload.
+    """
+    embedding_key = content_hash(
+        embedding_model, EmbeddingTaskType.RETRIEVAL_DOCUMENT, item.title, item.text
     )
+    payload_key = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{embedding_key}:{payload_key}".encode()).hexdigest()
+
+
+@dataclass
+class _Candidate:
+    """A point to be stored, before it has been embedded."""
+
+    point_id: str
+    item: EmbeddingItem
+    payload: dict
+
+
+@dataclass
+class _SyncState:
+    """Bookkeeping of the diff against the points already stored."""
+
+    stored_hashes: dict[ExtendedPointId, str | None]
+    seen_hashes: dict[ExtendedPointId, str] = field(default_factory=dict)
+    unchanged: int = 0
+
+
+def _iter_rows(
+    df_docs: pd.DataFrame | Iterable[pd.DataFrame],
+) -> Iterator[tuple[str, str, str | float]]:
+    """
+    Yields (file_name, meta_data, content) tuples, column-wise, from a DataFrame or
+    from a stream of DataFrame chunks. Missing content is read by pandas as NaN.
+    """
+    frames = [df_docs] if isinstance(df_docs, pd.DataFrame) else df_docs
+    for frame in frames:
+        yield from zip(
+            frame["file_name"], frame["meta_data"], frame["content"], strict=True
+        )
+
+
+def _document_candidate(
+    source: str,
+    chunk_index: int,
+    file_name: str,
+    text: str | float,
+    fields: dict[str, Any],
+) -> _Candidate | None:
+    """
+    Builds the candidate point of one document chunk, or None if its text is unusable.
+    `fields` holds the metadata and any other payload fields of the chunk.
+    """
+    if not isinstance(text, str) or len(text) < MIN_TEXT_LENGTH:
+        logger.warning(
+            "Skipping document due to missing or invalid content.", filename=file_name
+        )
+        return None
+
+    payload = {
+        "dataset": "docs",
+        "filename": file_name,
+        "text": text,
+        "document_id": f"docs/{source}",
+        "chunk_index": chunk_index,
+        **fields,
+    }
+
+    return _Candidate(
+        point_id=point_id("docs", source, chunk_index),
+        item=EmbeddingItem(text=text, title=file_name),
+        payload=payload,
+    )
+
+
+def _read_documents(
+    df_docs: pd.DataFrame | Iterable[pd.DataFrame],
+) -> Iterator[_Candidate]:
+    """
+    Read stage: yields one candidate point per valid raw CSV document.
+    """
+    # Several pages share a file name; number the repeats to keep their keys apart.
+    occurrences: dict[str, int] = {}
+    for file_name, meta_data, content in _iter_rows(df_docs):
+        occurrence = occurrences.get(file_name, 0)
+        occurrences[file_name] = occurrence + 1
+        source = file_name if occurrence == 0 else f"{file_name}~{occurrence}"
+
+        candidate = _document_candidate(
+            source, 0, file_name, content, {"metadata": meta_data}
+        )
+        if candidate is not None:
+            yield candidate
+
+
+def _read_chunks(folder: str) -> Iterator[_Candidate]:
+    """
+    Read stage: yields one candidate point per preprocessed chunk, each linked to
+    its parent document through `document_id` and `chunk_index`.
+    """
+    for chunk in iter_chunk_store(folder):
+        candidate = _document_candidate(
+            chunk["document_key"],
+            chunk["chunk_index"],
+            chunk["file_name"],
+            chunk["text"],
+            {
+                "metadata": chunk["meta_data"],
+                **{
+                    key: chunk[key]
+                    for key in ("original", "chunk_count", "title", "author", "date")
+                },
+            },
+        )
+        if candidate is not None:
+            yield candidate
+
+
+def _read_flare_data() -> Iterator[_Candidate]:
+    """
+    Read stage: yields a candidate point for every Flare FTSO entry.
+    """
+    flare_data_path = os.path.join(PROCESSED_DIR, "flare_data.json")
+    if not os.path.exists(flare_data_path):
+        return
+    with open(flare_data_path, "r", encoding="utf-8") as meta_file:
+        flare_content = json.load(meta_file)
+
+    for idx, entry in enumerate(flare_content):
+        text_content = f"Flare FTSO Data: {entry}"  # Convert JSON to text format
+        yield _Candidate(
+            point_id=point_id("flare_data", "flare_data.json", idx),
+            item=EmbeddingItem(text=text_content, title="Flare FTSO Update"),
+            payload={"dataset": "flare_data", "text": text_content},
+        )
+
+
+def bm25_index_path(collection_name: str) -> Path:
+    """
+    Returns where the BM25 index of a collection is persisted, next to the
+    processed data the collection is built from.
+    """
+    return Path(PROCESSED_DIR) / f"{collection_name}.bm25.json"
+
+
+def vector_index_path(collection_name: str) -> Path:
+    """
+    Returns where the NumPy export of a collection is written, next to its BM25
+    index.
+    """
+    return Path(PROCESSED_DIR) / f"{collection_name}.vectors"
+
+
+def collection_version_path(collection_name: str) -> Path:
+    """
+    Returns where the version of a collection is persisted, next to its BM25 index.
+    """
+    return Path(PROCESSED_DIR) / f"{collection_name}.version"
+
+
+def read_collection_version(collection_name: str) -> str | None:
+    """
+    Returns the version written by the last `generate_collection` run, or None if
+    the collection was never synchronized from this directory.
+    """
+    try:
+        return collection_version_path(collection_name).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _write_collection_version(
+    collection_name: str, point_hashes: dict[ExtendedPointId, str]
+) -> None:
+    """
+    Persists a digest of every (point ID, content hash) pair. It changes whenever a
+    point is added, changed or removed, and also when the embedding model changes.
+    """
+    digest = hashlib.sha256()
+    for point_id, point_hash in sorted((str(k), v) for k, v in point_hashes.items()):
+        digest.update(f"{point_id}:{point_hash}\n".encode())
+    path = collection_version_path(collection_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Written atomically: running answer caches read it as soon as it changes.
+    tmp_path = path.with_suffix(".version.tmp")
+    tmp_path.write_text(digest.hexdigest()[:16], encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _index_lexically(
+    candidates: Iterable[_Candidate], builder: BM25Builder
+) -> Iterator[_Candidate]:
+    """
+    Tap stage: adds every candidate, changed or not, to the BM25 index.
+    """
+    for candidate in candidates:
+        builder.add(candidate.point_id, candidate.item.text)
+        yield candidate
+
+
+def _changed_candidates(
+    candidates: Iterable[_Candidate], state: _SyncState, embedding_model: str
+) -> Iterator[_Candidate]:
+    """
+    Diff stage: only lets through points that are new or whose content changed.
+    """
+    for candidate in candidates:
+        candidate.payload["content_hash"] = _point_hash(
+            embedding_model, candidate.item, candidate.payload
+        )
+        state.seen_hashes[candidate.point_id] = candidate.payload["content_hash"]
+        if (
+            state.stored_hashes.get(candidate.point_id)
+            == candidate.payload["content_hash"]
+        ):
+            state.unchanged += 1
+            continue
+        yield candidate
+
+
+def _upload_points(
+    client: QdrantClient,
+    collection_name: str,
+    points: Iterable[PointStruct],
+    batch_size: int,
+    parallelism: int,
+) -> int:
+    """
+    Upsert stage: sends points in fixed-size batches from a pool of upload workers.
+    At most `parallelism` batches are in flight, which bounds the points held in memory.
+    """
+    uploaded = 0
+    in_flight: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=max(1, parallelism)) as executor:
+        for batch in itertools.batched(points, batch_size):
+            in_flight.append(
+                executor.submit(
+                    client.upsert, collection_name=collection_name, points=list(batch)
+                )
+            )
+            uploaded += len(batch)
+            while len(in_flight) >= max(1, parallelism):
+                in_flight.popleft().result()
+        for future in in_flight:
+            future.result()
+    return uploaded
+
 
 def generate_collection(
-    df_docs: pd.DataFrame,
+    df_docs: pd.DataFrame | Iterable[pd.DataFrame],
     qdrant_client: QdrantClient,
     retriever_config: RetrieverConfig,
     embedding_client: GeminiEmbedding,
 ) -> None:
     """
     Routine for generating a Qdrant collection with support for Flare FTSO data.
+
+    `df_docs` is either a DataFrame or a stream of DataFrame chunks (see
+    `iter_csv_chunks`), so large document dumps never need to be fully loaded.
+    Documents flow through a streaming pipeline (read -> diff -> embed -> upsert)
+    so that only a few batches are held in memory at any time and points become
+    searchable while the rest of the corpus is still being processed.
+
+    In "incremental" sync mode the existing collection is kept: only new or changed
+    points are embedded and upserted, and points that are no longer produced are
+    deleted. The "recreate" sync mode rebuilds the collection from scratch.
+
+    A BM25 index of every point is rebuilt alongside and saved to
+    `bm25_index_path(collection_name)` for hybrid retrieval.
     """
-    _create_collection(qdrant_client, retriever_config.collection_name, retriever_config.vector_size)
+    collection_name = retriever_config.collection_name
+    if retriever_config.sync_mode == "recreate":
+        _create_collection(qdrant_client, retriever_config)
+        state = _SyncState(stored_hashes={})
+    elif retriever_config.sync_mode == "incremental":
+        _ensure_collection(qdrant_client, retriever_config)
+        state = _SyncState(stored_hashes=_stored_hashes(qdrant_client, collection_name))
+    else:
+        msg = f"Unknown sync mode: {retriever_config.sync_mode}"
+        raise ValueError(msg)
+    _ensure_payload_indexes(qdrant_client, collection_name)
 
-    # Load preprocessed metadata
-    preprocessed_metadata_path = os.path.join(PROCESSED_DIR, "metadata.json")
-    if os.path.exists(preprocessed_metadata_path):
-        with open(preprocessed_metadata_path, "r", encoding="utf-8") as meta_file:
-            metadata = json.load(meta_file)
-        metadata_dict = {doc["original"]: doc for doc in metadata}
+    # Index every preprocessed chunk; fall back to one point per raw CSV document
+    if chunk_store_exists(PROCESSED_DIR):
+        documents = _read_chunks(PROCESSED_DIR)
     else:
-        logger.warning("No preprocessed metadata found. Using raw CSV data.")
-        metadata_dict = {}
-
-    points = []
-    
-    # ✅ Process standard documents
-    for idx, (_, row) in enumerate(df_docs.iterrows(), start=1):
-        file_name = row["file_name"]
-        content = row["content"]
-
-        # Use preprocessed text if available
-        if file_name in metadata_dict:
-            preprocessed_doc = metadata_dict[file_name]
-            chunk_path = os.path.join(PROCESSED_DIR, preprocessed_doc["filename"])
-            try:
-                with open(chunk_path, "r", encoding="utf-8") as file:
-                    content = file.read()
-            except Exception as e:
-                logger.warning(f"Could not read preprocessed chunk: {chunk_path}. Error: {e}")
-                continue
-
-        if not isinstance(content, str) or len(content) < 10:
-            logger.warning("Skipping document due to missing or invalid content.", filename=file_name)
-            continue
+        logger.warning("No preprocessed chunks found. Using raw CSV data.")
+        documents = _read_documents(df_docs)
 
-        try:
-            embedding = embedding_client.embed_content(
-                embedding_model=retriever_config.embedding_model,
-                task_type=EmbeddingTaskType.RETRIEVAL_DOCUMENT,
-                contents=content,
-                title=file_name,
-            )
-        except google.api_core.exceptions.InvalidArgument as e:
-            if "400 Request payload size exceeds the limit" in str(e):
-                logger.warning("Skipping document due to size limit.", filename=file_name)
-                continue
-            logger.exception("Error encoding document (InvalidArgument).", filename=file_name)
-            continue
-        except Exception:
-            logger.exception("Error encoding document (general).", filename=file_name)
-            continue
+    engine = BatchEmbeddingEngine(
+        embedding_client,
+        embedding_model=retriever_config.embedding_model,
+        task_type=EmbeddingTaskType.RETRIEVAL_DOCUMENT,
+        batch_size=retriever_config.embedding_batch_size,
+        max_concurrency=retriever_config.embedding_concurrency,
+        max_retries=retriever_config.embedding_max_retries,
+    )
 
-        payload = {
-            "filename": file_name,
-            "metadata": row["meta_data"],
-            "text": content,
-        }
+    # ✅ Read standard documents followed by external Flare FTSO data
+    candidates = itertools.chain(documents, _read_flare_data())
 
-        # Add metadata
-        if file_name in metadata_dict:
-            payload.update(metadata_dict[file_name])
+    # ✅ Index the whole corpus lexically, then only embed new or changed points
+    bm25_builder = BM25Builder()
+    candidates = _index_lexically(candidates, bm25_builder)
+    changed = _changed_candidates(candidates, state, retriever_config.embedding_model)
 
-        points.append(PointStruct(id=idx, vector=embedding, payload=payload))
+    # ✅ Embed in batches and upsert as soon as each batch is ready
+    points = (
+        PointStruct(id=candidate.point_id, vector=embedding, payload=candidate.payload)
+        for candidate, embedding in engine.embed_stream(
+            changed, lambda candidate: candidate.item
+        )
+        if embedding is not None
+    )
+    uploaded = _upload_points(
+        qdrant_client,
+        collection_name,
+        points,
+        batch_size=retriever_config.upsert_batch_size,
+        parallelism=retriever_config.upsert_parallelism,
+    )
 
-    # ✅ Process external Flare FTSO data
-    flare_data_path = os.path.join(PROCESSED_DIR, "flare_data.json")
-    if os.path.exists(flare_data_path):
-        with open(flare_data_path, "r", encoding="utf-8") as meta_file:
-            flare_content = json.load(meta_file)
-
-        for idx, entry in enumerate(flare_content, start=len(points) + 1):
-            text_content = f"Flare FTSO Data: {entry}"  # Convert JSON to text format
-
-            try:
-                embedding = embedding_client.embed_content(
-                    embedding_model=retriever_config.embedding_model,
-                    task_type=EmbeddingTaskType.RETRIEVAL_DOCUMENT,
-                    contents=text_content,
-                    title="Flare FTSO Update"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to embed Flare data: {e}")
-                continue  # Skip this entry if embedding fails
+    if uploaded:
+        logger.info(f"✅ Stored {uploaded} documents in Qdrant.")
+    elif not state.seen_hashes:
+        logger.warning("No valid documents found to insert.")
 
-            points.append(PointStruct(id=idx, vector=embedding, payload={"dataset": "flare_data", "text": text_content}))
+    # ✅ Drop points that are no longer part of the corpus
+    stale_ids = [
+        point_id
+        for point_id in state.stored_hashes
+        if point_id not in state.seen_hashes
+    ]
+    if stale_ids:
+        qdrant_client.delete(
+            collection_name=collection_name,
+            points_selector=PointIdsList(points=stale_ids),
+        )
 
-    if points:
-        qdrant_client.upsert(collection_name=retriever_config.collection_name, points=points)
-        logger.info(f"✅ Stored {len(points)} documents in Qdrant.")
-    else:
-        logger.warning("No valid documents found to insert.")
+    # ✅ Persist the lexical index next to the collection for hybrid retrieval
+    bm25_builder.build().save(bm25_index_path(collection_name))
+    _write_collection_version(collection_name, state.seen_hashes)
+
+    logger.info(
+        "Collection synchronized.",
+        collection_name=collection_name,
+        sync_mode=retriever_config.sync_mode,
+        unchanged=state.unchanged,
+        upserted=uploaded,
+        deleted=len(stale_ids),
+    )
@@ -1,9 +1,25 @@
+import itertools
+import numpy as np
 import structlog  # Ensure logger is available
-from typing import override, Any
+from collections.abc import Iterator, Sequence
+from typing import override, Any, cast
 from qdrant_client import QdrantClient
+from qdrant_client.http.models import (
+    QuantizationSearchParams,
+    Record,
+    ScoredPoint,
+    SearchParams,
+    SearchRequest,
+)
 from flare_ai_rag.ai import EmbeddingTaskType, GeminiEmbedding
+from flare_ai_rag.ai.gemini import EMBEDDING_MAX_BATCH_SIZE
 from flare_ai_rag.retriever.base import BaseRetriever
+from flare_ai_rag.retriever.bm25 import BM25Index, reciprocal_rank_fusion
 from flare_ai_rag.retriever.config import RetrieverConfig
+from flare_ai_rag.retriever.filters import SearchFilters, build_filter, payload_matches
+from flare_ai_rag.retriever.mmr import mmr_select
+from flare_ai_rag.retriever.numpy_index import normalize_rows
+from flare_ai_rag.retriever.query_cache import QueryVectorCache
 import os
 import json
 
@@ -11,87 +27,656 @@ logger = structlog.get_logger(__name__)  # Define logger
 
 PROCESSED_DIR = "processed_data/"  # Folder where preprocessed & external data is stored
 
-class QdrantRetriever(BaseRetriever):
+
+# Payload fields read by `payload_to_document`; searches fetch only these, so the
+# merged chunk metadata never leaves Qdrant.
+DOCUMENT_PAYLOAD_FIELDS = (
+    "text",
+    "dataset",
+    "filename",
+    "document_id",
+    "chunk_index",
+    "title",
+    "author",
+    "date",
+)
+
+
+def payload_fields(filters: SearchFilters | None = None) -> list[str]:
+    """
+    Payload fields to fetch for search hits: the document fields plus the filtered
+    fields, which lexical hits are checked against client-side.
+    """
+    return list(dict.fromkeys([*DOCUMENT_PAYLOAD_FIELDS, *(filters or {})]))
+
+
+def payload_to_document(
+    payload: dict[str, Any], score: float, text_window: int | None = None
+) -> dict[str, Any]:
+    """
+    Convert a stored point payload and its score into a retrieved document.
+
+    `text_window` caps the returned text at that many characters.
+    """
+    dataset = payload.get("dataset", "RAG")
+    text = payload.get("text", "")
+    document = {
+        "text": text[:text_window] if text_window is not None else text,
+        "score": score,
+        "source": payload.get("filename", dataset),
+        "document_id": payload.get("document_id"),
+        "chunk_index": payload.get("chunk_index", 0),
+    }
+    for key in ("title", "author", "date"):
+        if payload.get(key):
+            document[key] = payload[key]
+    return document
+
+
+def hits_to_documents(
+    results: list[ScoredPoint], text_window: int | None = None
+) -> list[dict[str, Any]]:
+    """
+    Convert Qdrant search hits into the retriever's document dictionaries.
+    Returns a **single list of documents** instead of a dictionary.
+    """
+    retrieved_docs = []  # ✅ A single list instead of a dictionary
+
+    for hit in results:
+        if hit.payload:
+            retrieved_docs.append(
+                payload_to_document(hit.payload, hit.score, text_window)
+            )
+        else:
+            logger.warning(f"⚠️ Missing payload for search result: {hit}")
+
+    return retrieved_docs  # ✅ Now it returns List[Dict[str, Any]]
+
+
+def cached_query_vectors(
+    query_cache: QueryVectorCache | None,
+    embedding_model: str,
+    queries: Sequence[str],
+) -> list[list[float] | None]:
+    """
+    Look up the vector of every query in `query_cache`, None for each miss.
+    """
+    return [
+        query_cache.get(embedding_model, query) if query_cache is not None else None
+        for query in queries
+    ]
+
+
+def missing_query_batches(
+    vectors: Sequence[list[float] | None],
+) -> Iterator[tuple[int, ...]]:
+    """
+    Group the positions of the queries still missing a vector into batches that
+    fit one embedding request.
+    """
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    return itertools.batched(missing, EMBEDDING_MAX_BATCH_SIZE)
+
+
+def store_query_vectors(  # noqa: PLR0913
+    vectors: list[list[float] | None],
+    batch: Sequence[int],
+    embeddings: Sequence[list[float]],
+    *,
+    queries: Sequence[str],
+    query_cache: QueryVectorCache | None,
+    embedding_model: str,
+) -> None:
+    """
+    Fill in the vectors of an embedded batch and cache them.
+    """
+    for i, vector in zip(batch, embeddings, strict=True):
+        vectors[i] = vector
+        if query_cache is not None:
+            query_cache.put(embedding_model, queries[i], vector)
+
+
+def embed_query_batch(
+    embedding_client: GeminiEmbedding,
+    embedding_model: str,
+    queries: Sequence[str],
+    query_cache: QueryVectorCache | None = None,
+) -> list[list[float]]:
+    """
+    Embed queries in as few batch requests as possible, serving repeated queries
+    from `query_cache` and caching the new vectors.
+    """
+    vectors = cached_query_vectors(query_cache, embedding_model, queries)
+    for batch in missing_query_batches(vectors):
+        embeddings = embedding_client.embed_contents(
+            embedding_model=embedding_model,
+            contents=[queries[i] for i in batch],
+            task_type=EmbeddingTaskType.RETRIEVAL_QUERY,
+        )
+        store_query_vectors(
+            vectors,
+            batch,
+            embeddings,
+            queries=queries,
+            query_cache=query_cache,
+            embedding_model=embedding_model,
+        )
+    return [vector for vector in vectors if vector is not None]
+
+
+def search_params(retriever_config: RetrieverConfig) -> SearchParams | None:
+    """
+    Build the Qdrant search parameters selected by the retriever config.
+
+    `hnsw_ef` widens the HNSW beam (more recall, more latency). On quantized
+    collections, `oversampling * limit` candidates are scored on the compressed
+    vectors and, with `rescore`, re-ranked against the original ones.
+    """
+    quantization = None
+    if retriever_config.quantization != "none":
+        quantization = QuantizationSearchParams(
+            rescore=retriever_config.rescore,
+            oversampling=retriever_config.oversampling,
+        )
+    if retriever_config.hnsw_ef is None and quantization is None:
+        return None
+    return SearchParams(hnsw_ef=retriever_config.hnsw_ef, quantization=quantization)
+
+
+def lexical_ranking(bm25_index: BM25Index, query: str, limit: int) -> list[str]:
+    """
+    Returns the IDs of the `limit` points ranked best by BM25 for a query.
+    """
+    return [doc_id for doc_id, _ in bm25_index.search(query, top_k=limit)]
+
+
+def fuse_with_lexical(  # noqa: PLR0913
+    results: list[ScoredPoint],
+    lexical: list[str],
+    payloads: dict[str, dict[str, Any]],
+    top_k: int,
+    rrf_k: int = 60,
+    filters: SearchFilters | None = None,
+    text_window: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Merge dense search hits with a lexical ranking using RRF and build the
+    documents of the `top_k` best points from `payloads`.
+
+    Dense hits already satisfy the filters; lexical hits are checked against them
+    here. Points whose payload is unavailable (e.g. deleted since indexing) are
+    skipped.
+    """
+    dense_ranking = [str(hit.id) for hit in results]
+    lexical_ranking = [
+        doc_id
+        for doc_id in lexical
+        if payloads.get(doc_id) and payload_matches(payloads[doc_id], filters)
+    ]
+    fused = reciprocal_rank_fusion([dense_ranking, lexical_ranking], k=rrf_k)
+    return [
+        payload_to_document(payloads[doc_id], score, text_window)
+        for doc_id, score in fused[:top_k]
+        if payloads.get(doc_id)
+    ]
+
+
+def adaptive_cutoff(scores: Sequence[float], min_k: int, score_gap: float) -> int:
+    """
+    Number of leading results to keep: everything before the first score drop
+    larger than `score_gap` times the best score, but at least `min_k`.
+
+    A clear lookup (one dominant hit) keeps few results; a broad question with
+    flat scores keeps them all.
+    """
+    if not scores or scores[0] <= 0:
+        return len(scores)
+    for rank in range(max(1, min_k), len(scores)):
+        if scores[rank - 1] - scores[rank] > score_gap * scores[0]:
+            return rank
+    return len(scores)
+
+
+def adaptive_limit(
+    scores: Sequence[float], retriever_config: RetrieverConfig, limit: int
+) -> int:
+    """
+    Number of results to keep out of `limit`, given the cosine scores of the dense
+    hits. The scores are ranked first, so MMR or fusion order does not affect the
+    cut.
+    """
+    if not retriever_config.adaptive_top_k:
+        return limit
+    keep = adaptive_cutoff(
+        sorted(scores, reverse=True),
+        retriever_config.min_top_k,
+        retriever_config.score_gap,
+    )
+    return min(limit, keep)
+
+
+def cut_documents(
+    documents: list[dict[str, Any]], retriever_config: RetrieverConfig
+) -> list[dict[str, Any]]:
+    """Apply the configured adaptive cut-off to documents with cosine scores."""
+    keep = adaptive_limit(
+        [document["score"] for document in documents],
+        retriever_config,
+        len(documents),
+    )
+    return documents[:keep]
+
+
+def filter_lexical_by_score(
+    ranking: list[str],
+    dense_ids: set[str],
+    vectors: dict[str, list[float]],
+    query_vector: Sequence[float],
+    score_threshold: float,
+) -> list[str]:
+    """
+    Drop lexical hits whose cosine similarity to the query is below
+    `score_threshold`. Dense hits already passed the threshold in Qdrant; lexical
+    hits without a known vector are dropped.
+
+    The best BM25 hit is exempt: short exact-match queries (acronyms, addresses)
+    often score low against long chunks, and recovering them is what the lexical
+    ranking is for.
+    """
+    strongest = ranking[:1]
+    lexical_only = [
+        doc_id
+        for doc_id in ranking[1:]
+        if doc_id not in dense_ids and doc_id in vectors
+    ]
+    passing: set[str] = set()
+    if lexical_only:
+        query = normalize_rows(np.atleast_2d(query_vector))[0]
+        scores = normalize_rows(np.asarray([vectors[i] for i in lexical_only])) @ query
+        passing = {
+            doc_id
+            for doc_id, score in zip(lexical_only, scores.tolist(), strict=True)
+            if score >= score_threshold
+        }
+    return [
+        doc_id
+        for doc_id in ranking
+        if doc_id in dense_ids or doc_id in passing or doc_id in strongest
+    ]
+
+
+def dense_vector(point: ScoredPoint | Record) -> list[float] | None:
+    """The dense vector of a point, or None if it was not fetched."""
+    vector = point.vector
+    if isinstance(vector, list) and not (vector and isinstance(vector[0], list)):
+        return cast("list[float]", vector)
+    return None
+
+
+def diversify_hits(
+    results: list[ScoredPoint],
+    query_vector: Sequence[float],
+    limit: int,
+    diversity: float,
+) -> list[ScoredPoint]:
+    """
+    Keep `limit` relevant yet diverse hits, chosen with maximal marginal relevance.
+
+    Hits must carry their vectors (`with_vectors=True`); without them, or with a
+    zero `diversity`, the `limit` best hits are kept in relevance order.
+    """
+    if not results:
+        return []
+    vectors = [vector for hit in results if (vector := dense_vector(hit)) is not None]
+    if diversity <= 0 or len(vectors) < len(results):
+        return results[:limit]
+    return [results[i] for i in mmr_select(query_vector, vectors, limit, diversity)]
+
+
+class QdrantSearchMixin:
+    """
+    Search planning and hit post-processing shared by the sync and async Qdrant
+    retrievers, which only differ in how they talk to Qdrant and the embedder.
+    """
+
+    def __init__(
+        self,
+        retriever_config: RetrieverConfig,
+        query_cache: QueryVectorCache | None = None,
+        bm25_index: BM25Index | None = None,
+    ) -> None:
+        self.retriever_config = retriever_config
+        self.query_cache = query_cache
+        self.bm25_index = bm25_index
+
+    @property
+    def hybrid(self) -> bool:
+        """Whether searches fuse dense and lexical rankings."""
+        return (
+            self.retriever_config.retrieval_mode == "hybrid"
+            and self.bm25_index is not None
+        )
+
+    @property
+    def diversify(self) -> bool:
+        """Whether dense hits are diversified with maximal marginal relevance."""
+        return self.retriever_config.mmr_diversity > 0
+
+    def _cached_query_vector(self, query: str) -> list[float] | None:
+        """Return the cached vector of a query, if any."""
+        if self.query_cache is None:
+            return None
+        cached = self.query_cache.get(self.retriever_config.embedding_model, query)
+        if cached is not None:
+            logger.debug(
+                "Query vector served from cache.",
+                hit_rate=round(self.query_cache.hit_rate, 3),
+            )
+        return cached
+
+    def _cache_query_vector(self, query: str, query_vector: list[float]) -> None:
+        if self.query_cache is not None:
+            self.query_cache.put(
+                self.retriever_config.embedding_model, query, query_vector
+            )
+
+    def _result_limit(self, top_k: int) -> int:
+        """Maximum number of documents returned per query."""
+        if self.retriever_config.adaptive_top_k:
+            return max(top_k, self.retriever_config.max_top_k)
+        return top_k
+
+    def _search_limit(self, top_k: int) -> int:
+        """Number of dense hits kept per query."""
+        if self.hybrid:
+            return max(top_k, self.retriever_config.hybrid_candidates)
+        return top_k
+
+    def _fetch_limit(self, top_k: int) -> int:
+        """Number of dense hits fetched per query, MMR candidates included."""
+        if self.diversify:
+            return max(self._search_limit(top_k), self.retriever_config.mmr_candidates)
+        return self._search_limit(top_k)
+
+    def _search_requests(
+        self,
+        query_vectors: Sequence[list[float]],
+        top_k: int,
+        filters: SearchFilters | None,
+    ) -> list[SearchRequest]:
+        """Build the dense search request of every query."""
+        query_filter = build_filter(filters)
+        params = search_params(self.retriever_config)
+        with_payload = payload_fields(filters)
+        return [
+            SearchRequest(
+                vector=query_vector,
+                filter=query_filter,
+                params=params,
+                limit=self._fetch_limit(top_k),
+                with_payload=with_payload,
+                with_vector=self.diversify,
+                score_threshold=self.retriever_config.score_threshold,
+            )
+            for query_vector in query_vectors
+        ]
+
+    def _diversify(
+        self,
+        query_vectors: Sequence[list[float]],
+        batch_results: list[list[ScoredPoint]],
+        top_k: int,
+    ) -> list[list[ScoredPoint]]:
+        """Reduce the fetched hits of each query to a diverse `_search_limit`."""
+        if not self.diversify:
+            return batch_results
+        return [
+            diversify_hits(
+                results,
+                query_vector,
+                self._search_limit(top_k),
+                self.retriever_config.mmr_diversity,
+            )
+            for query_vector, results in zip(query_vectors, batch_results, strict=True)
+        ]
+
+    @property
+    def lexical_vectors(self) -> bool:
+        """
+        Whether lexical-only hits are fetched with their vectors, so they can be
+        held to `score_threshold` like dense hits.
+        """
+        return self.retriever_config.score_threshold is not None
+
+    def _lexical_rankings(
+        self,
+        queries: Sequence[str],
+        batch_results: list[list[ScoredPoint]],
+        top_k: int,
+    ) -> tuple[list[list[str]], list[str]]:
+        """
+        Rank every query lexically in hybrid mode. Also returns the IDs of the
+        lexical-only hits, across all queries, whose payloads (and, with a score
+        threshold, vectors) must be fetched.
+        """
+        if not self.hybrid or self.bm25_index is None:
+            return [], []
+        bm25_index = self.bm25_index
+        lexical = [
+            lexical_ranking(bm25_index, query, len(results) or top_k)
+            for query, results in zip(queries, batch_results, strict=True)
+        ]
+        known = {
+            str(hit.id)
+            for results in batch_results
+            for hit in results
+            if not self.lexical_vectors or isinstance(hit.vector, list)
+        }
+        missing = list(
+            dict.fromkeys(
+                doc_id
+                for ranking, results in zip(lexical, batch_results, strict=True)
+                for doc_id in ranking
+                if doc_id not in known
+                and doc_id not in {str(hit.id) for hit in results}
+            )
+        )
+        return lexical, missing
+
+    def _to_documents(  # noqa: PLR0913
+        self,
+        query_vectors: Sequence[list[float]],
+        batch_results: list[list[ScoredPoint]],
+        lexical: list[list[str]],
+        records: Sequence[Record],
+        *,
+        top_k: int,
+        filters: SearchFilters | None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Turn the dense hits of each query into documents, fusing them with the
+        lexical ranking in hybrid mode; `records` holds the payloads of the
+        lexical-only hits.
+
+        `score_threshold` and the adaptive cut-off are measured on cosine
+        scores: lexical hits below the threshold are dropped before fusion, and
+        the dense scores decide how many fused documents are kept. The best BM25
+        hit is exempt from the threshold and, if dense search missed it, kept in
+        addition to the dense hits.
+        """
+        config = self.retriever_config
+        if not lexical:
+            return [
+                cut_documents(hits_to_documents(results, config.text_window), config)
+                for results in batch_results
+            ]
+
+        payloads = {
+            str(hit.id): hit.payload or {}
+            for results in batch_results
+            for hit in results
+        }
+        payloads.update({str(record.id): record.payload or {} for record in records})
+        vectors = {
+            str(point.id): vector
+            for point in itertools.chain(*batch_results, records)
+            if (vector := dense_vector(point)) is not None
+        }
+        documents = []
+        for query_vector, results, ranking in zip(
+            query_vectors, batch_results, lexical, strict=True
+        ):
+            dense_ids = {str(hit.id) for hit in results}
+            candidates = ranking
+            if config.score_threshold is not None:
+                candidates = filter_lexical_by_score(
+                    ranking,
+                    dense_ids,
+                    vectors,
+                    query_vector,
+                    config.score_threshold,
+                )
+            keep = adaptive_limit([hit.score for hit in results], config, top_k)
+            if ranking and ranking[0] not in dense_ids:
+                keep = min(top_k, keep + 1)
+            documents.append(
+                fuse_with_lexical(
+                    results,
+                    candidates,
+                    payloads,
+                    keep,
+                    config.rrf_k,
+                    filters,
+                    config.text_window,
+                )
+            )
+        return documents
+
+
+class QdrantRetriever(QdrantSearchMixin, BaseRetriever):
     def __init__(
         self,
         client: QdrantClient,
         retriever_config: RetrieverConfig,
         embedding_client: GeminiEmbedding,
+        query_cache: QueryVectorCache | None = None,
+        bm25_index: BM25Index | None = None,
     ) -> None:
-        """Initialize the QdrantRetriever."""
+        """
+        Initialize the QdrantRetriever.
+
+        `query_cache` keeps the vectors of recent queries so repeated questions
+        skip the embedding call. With a `bm25_index` and the "hybrid" retrieval
+        mode, dense hits are fused with a lexical ranking. A positive
+        `mmr_diversity` fetches `mmr_candidates` hits with their vectors and
+        keeps a diverse subset chosen with maximal marginal relevance.
+        """
+        super().__init__(retriever_config, query_cache, bm25_index)
         self.client = client
-        self.retriever_config = retriever_config
         self.embedding_client = embedding_client
 
     @override
-    def semantic_search(self, query: str, top_k: int = 5) -> list[dict[str, Any]]:
-        """
-        Perform semantic search using preprocessed document chunks and Flare data.
-        Returns a **single list of documents** instead of a dictionary.
-        """
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a query, serving repeated queries from the query cache."""
+        cached = self._cached_query_vector(query)
+        if cached is not None:
+            return cached
         query_vector = self.embedding_client.embed_content(
             embedding_model=self.retriever_config.embedding_model,
             contents=query,
             task_type=EmbeddingTaskType.RETRIEVAL_QUERY,
         )
+        self._cache_query_vector(query, query_vector)
+        return query_vector
 
-        results = self.client.search(
-            collection_name=self.retriever_config.collection_name,
-            query_vector=query_vector,
-            limit=top_k,
+    def embed_queries(self, queries: Sequence[str]) -> list[list[float]]:
+        """Embed queries in batch requests, serving repeats from the query cache."""
+        return embed_query_batch(
+            self.embedding_client,
+            self.retriever_config.embedding_model,
+            queries,
+            self.query_cache,
         )
 
-        retrieved_docs = []  # ✅ A single list instead of a dictionary
-
-        for hit in results:
-            if hit.payload:
-                dataset = hit.payload.get("dataset", "RAG")
-                text = hit.payload.get("text", "")
-                metadata = hit.payload.get("metadata", {})
-
-                doc_entry = {
-                    "text": text,
-                    "score": hit.score,
-                    "source": metadata.get("original", dataset),
-                }
-                retrieved_docs.append(doc_entry)  # ✅ Append everything to a single list
-            else:
-                logger.warning(f"⚠️ Missing payload for search result: {hit}")
-
-        return retrieved_docs  # ✅ Now it returns List[Dict[str, Any]]
-
-def search_relevant_documents(query: str, top_k: int = 5) -> list[dict[str, Any]]:
-    """
-    Wrapper function to call `semantic_search` from `QdrantRetriever`.
-    Ensures correct parameter types before retrieving documents.
-    """
-    try:
-        # ✅ Initialize Qdrant Client
-        qdrant_client = QdrantClient(host="localhost", port=6333)
-
-        # ✅ Correct RetrieverConfig Initialization
-        retriever_config = RetrieverConfig(
-            embedding_model="models/text-embedding-004",
-            collection_name="documents",
-            vector_size=768,
-            host="localhost",
-            port=6333
-        )
+    @override
+    def semantic_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+        query_vector: list[float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Perform semantic search using preprocessed document chunks and Flare data.
+        Returns a **single list of documents** instead of a dictionary.
 
-        # ✅ Initialize Gemini Embedding
-        embedding_client = GeminiEmbedding(api_key="YOUR_GEMINI_API_KEY")
+        `filters` restricts the search to points whose payload matches, e.g.
+        `{"dataset": "flare_data"}`; Qdrant applies it through payload indexes.
+        Hits scoring below `score_threshold` are dropped, and with `adaptive_top_k`
+        the result is cut at the first large score gap, returning between
+        `min_top_k` and `max(top_k, max_top_k)` documents.
+        """
+        if query_vector is None:
+            query_vector = self.embed_query(query)
+        return self._search([query], [query_vector], top_k, filters)[0]
 
-        retriever = QdrantRetriever(
-            client=qdrant_client,
-            retriever_config=retriever_config,
-            embedding_client=embedding_client,
-        )
+    @override
+    def semantic_search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        filters: SearchFilters | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search several queries with one batched embedding call and a single
+        Qdrant `search_batch` request.
 
-        retrieved_data = retriever.semantic_search(query=query, top_k=top_k)
-        
+        Args:
+            queries (Sequence[str]): The queries to search for.
+            top_k (int): Number of documents returned per query.
+            filters (SearchFilters | None): Payload filters applied to every query.
 
-        return retrieved_data
-    
-    except Exception as e:
-        logger.error(f"Error in search_relevant_documents: {e}")
-        return []  # ✅ Return an empty list instead of an incorrect type
+        Returns:
+            list[list[dict[str, Any]]]: The retrieved documents of each query,
+                in query order.
+        """
+        if not queries:
+            return []
+        return self._search(queries, self.embed_queries(queries), top_k, filters)
+
+    def _search(
+        self,
+        queries: Sequence[str],
+        query_vectors: list[list[float]],
+        top_k: int,
+        filters: SearchFilters | None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search embedded queries with one `search_batch` request, then fetch the
+        payloads of lexical-only hits in a single call.
+        """
+        top_k = self._result_limit(top_k)
+        batch_results = self.client.search_batch(
+            collection_name=self.retriever_config.collection_name,
+            requests=self._search_requests(query_vectors, top_k, filters),
+        )
+        batch_results = self._diversify(query_vectors, batch_results, top_k)
+        lexical, missing = self._lexical_rankings(queries, batch_results, top_k)
+        records = (
+            self.client.retrieve(
+                collection_name=self.retriever_config.collection_name,
+                ids=missing,
+                with_payload=payload_fields(filters),
+                with_vectors=self.lexical_vectors,
+            )
+            if missing
+            else []
+        )
+        return self._to_documents(
+            query_vectors,
+            batch_results,
+            lexical,
+            records,
+            top_k=top_k,
+            filters=filters,
+        )
@@ -0,0 +1,111 @@
+"""
+Query Vector Cache Module
+
+This module implements a small in-process cache of query embeddings. Popular
+questions are asked over and over, so their vectors are kept in least-recently-used
+order for a limited time and repeated queries skip the embedding round trip.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query so trivially different spellings share a cache entry.
+
+    Args:
+        query (str): The raw query text.
+
+    Returns:
+        str: The case-folded query with whitespace collapsed.
+    """
+    return " ".join(query.casefold().split())
+
+
+class QueryVectorCache:
+    """
+    Thread-safe LRU cache of query vectors whose entries expire after a TTL.
+
+    Attributes:
+        max_entries (int): Maximum number of vectors kept before evicting.
+        ttl_seconds (float): Lifetime of an entry; 0 or less disables expiry.
+        hits (int): Number of successful lookups.
+        misses (int): Number of failed lookups, including expired entries.
+        evictions (int): Number of entries dropped because the cache was full.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[float]]] = (
+            OrderedDict()
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, embedding_model: str, query: str) -> list[float] | None:
+        """Return the cached vector of a query, or None on a miss."""
+        key = (embedding_model, normalize_query(query))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, embedding_model: str, query: str, vector: list[float]) -> None:
+        """Store the vector of a query, evicting the least recently used if full."""
+        key = (embedding_model, normalize_query(query))
+        with self._lock:
+            self._entries[key] = (self._clock(), vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Return the cache counters, e.g. for logging or a metrics endpoint."""
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and self._clock() - stored_at > self.ttl_seconds
@@ -0,0 +1,86 @@
+"""
+Retrieval Service Module
+
+This module provides the process-wide retrieval service shared by the router and
+the responder. It wraps the retriever built once at startup, so the Qdrant client
+(and its HTTP connection pool) and the embedding client are created and configured
+a single time instead of on every request.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import structlog
+
+from flare_ai_rag.retriever.base import BaseRetriever
+from flare_ai_rag.retriever.filters import SearchFilters
+
+logger = structlog.get_logger(__name__)
+
+
+class RetrievalService:
+    """
+    Shared front-end to a retriever, injected into the RAG components.
+
+    Attributes:
+        retriever (BaseRetriever): The retriever every search is delegated to.
+        top_k (int): Number of documents returned when no `top_k` is given.
+    """
+
+    def __init__(self, retriever: BaseRetriever, top_k: int = 5) -> None:
+        self.retriever = retriever
+        self.top_k = top_k
+
+    def search(
+        self,
+        query: str,
+        top_k: int | None = None,
+        filters: SearchFilters | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieve the documents most relevant to a query.
+
+        Retrieval only adds context, so failures are logged and an empty list is
+        returned rather than failing the request.
+
+        Args:
+            query (str): The query to search for.
+            top_k (int | None): Number of documents to return.
+            filters (SearchFilters | None): Payload filters, e.g.
+                `{"dataset": "flare_data"}`.
+
+        Returns:
+            list[dict[str, Any]]: The retrieved documents, best first.
+        """
+        try:
+            return self.retriever.semantic_search(
+                query, top_k=top_k or self.top_k, filters=filters
+            )
+        except Exception:
+            logger.exception("Retrieval failed.", query=query)
+            return []
+
+    def search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int | None = None,
+        filters: SearchFilters | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Retrieve documents for several queries at once.
+
+        Args:
+            queries (Sequence[str]): The queries to search for.
+            top_k (int | None): Number of documents to return per query.
+            filters (SearchFilters | None): Payload filters applied to every query.
+
+        Returns:
+            list[list[dict[str, Any]]]: The retrieved documents of each query.
+        """
+        try:
+            return self.retriever.semantic_search_batch(
+                queries, top_k=top_k or self.top_k, filters=filters
+            )
+        except Exception:
+            logger.exception("Batch retrieval failed.", queries=len(queries))
+            return [[] for _ in queries]
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from flare_ai_rag.retriever import PipelineContext
+
 
 class BaseQueryRouter(ABC):
     """
@@ -13,7 +15,11 @@ class BaseQueryRouter(ABC):
         prompt: str,
         response_mime_type: str | None = None,
         response_schema: Any | None = None,
+        pipeline_context: PipelineContext | None = None,
     ) -> str:
         """
         Determine the type of the query: ANSWER, CLARIFY, or REJECT.
+
+        A `pipeline_context` that already holds retrieved documents is used
+        instead of searching again.
         """
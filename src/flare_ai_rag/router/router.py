@@ -8,7 +8,7 @@ from flare_ai_rag.utils import (
     parse_chat_response_as_json,
     parse_gemini_response_as_json,
 )
-from flare_ai_rag.retriever.qdrant_retriever import search_relevant_documents  # Import retrieval function
+from flare_ai_rag.retriever import PipelineContext, RetrievalService
 
 logger = structlog.get_logger(__name__)
 
@@ -18,12 +18,19 @@ class GeminiRouter(BaseQueryRouter):
     to classify a query as ANSWER, CLARIFY, or REJECT.
     """
 
-    def __init__(self, client: GeminiProvider, config: RouterConfig) -> None:
+    def __init__(
+        self,
+        client: GeminiProvider,
+        config: RouterConfig,
+        retrieval: RetrievalService | None = None,
+    ) -> None:
         """
-        Initialize the router with a GeminiProvider instance.
+        Initialize the router with a GeminiProvider instance and the shared
+        retrieval service used to add document context to the prompt.
         """
         self.router_config = config
         self.client = client
+        self.retrieval = retrieval
 
     @override
     def route_query(
@@ -31,6 +38,7 @@ class GeminiRouter(BaseQueryRouter):
         prompt: str,
         response_mime_type: str | None = None,
         response_schema: Any | None = None,
+        pipeline_context: PipelineContext | None = None,
     ) -> str:
         """
         Analyze the query using the configured prompt and classify it.
@@ -39,7 +47,13 @@ class GeminiRouter(BaseQueryRouter):
         logger.debug("Sending prompt...", prompt=prompt)
 
         # ✅ Retrieve external knowledge (GitHub, Google Trends, Flare)
-        retrieved_data = search_relevant_documents(prompt, top_k=5)
+        # unless this request already retrieved its documents
+        if pipeline_context is not None and pipeline_context.documents is not None:
+            retrieved_data = pipeline_context.documents
+        else:
+            retrieved_data = (
+                self.retrieval.search(prompt, top_k=5) if self.retrieval else []
+            )
         extra_data = retrieved_data
 
         if extra_data:
@@ -85,12 +99,19 @@ class QueryRouter(BaseQueryRouter):
     classify a query as ANSWER, CLARIFY, or REJECT.
     """
 
-    def __init__(self, client: OpenRouterClient, config: RouterConfig) -> None:
+    def __init__(
+        self,
+        client: OpenRouterClient,
+        config: RouterConfig,
+        retrieval: RetrievalService | None = None,
+    ) -> None:
         """
-        Initialize the router with an OpenRouter client and model configuration.
+        Initialize the router with an OpenRouter client, model configuration and
+        the shared retrieval service used to add document context to the prompt.
         """
         self.router_config = config
         self.client = client
+        self.retrieval = retrieval
 
     @override
     def route_query(
@@ -98,6 +119,7 @@ class QueryRouter(BaseQueryRouter):
         prompt: str,
         response_mime_type: str | None = None,
         response_schema: Any | None = None,
+        pipeline_context: PipelineContext | None = None,
     ) -> str:
         """
         Analyze the query using the configured prompt and classify it.
@@ -106,7 +128,13 @@ class QueryRouter(BaseQueryRouter):
         logger.debug("Processing query routing...", prompt=prompt)
 
         # ✅ Retrieve external data
-        retrieved_data = search_relevant_documents(prompt, top_k=5)
+        # unless this request already retrieved its documents
+        if pipeline_context is not None and pipeline_context.documents is not None:
+            retrieved_data = pipeline_context.documents
+        else:
+            retrieved_data = (
+                self.retrieval.search(prompt, top_k=5) if self.retrieval else []
+            )
         extra_data = retrieved_data
 
         if extra_data:
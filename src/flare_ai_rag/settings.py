@@ -35,6 +35,9 @@ class Settings(BaseSettings):
     # Path Settings
     data_path: Path = create_path("data")
     input_path: Path = create_path("flare_ai_rag")
+    embedding_cache_path: Path = create_path("embedding_cache")
+    # Embedded Qdrant storage used by the "numpy" retriever backend
+    qdrant_local_path: Path = create_path("qdrant_data")
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
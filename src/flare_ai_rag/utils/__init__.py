@@ -1,4 +1,4 @@
-from .file_utils import load_json, load_txt, save_json
+from .file_utils import iter_csv_chunks, load_json, load_txt, save_json
 from .parser_utils import (
     extract_author,
     parse_chat_response,
@@ -8,6 +8,7 @@ from .parser_utils import (
 
 __all__ = [
     "extract_author",
+    "iter_csv_chunks",
     "load_json",
     "load_txt",
     "parse_chat_response",
@@ -1,6 +1,8 @@
 import json
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 
+import pandas as pd
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -24,3 +26,23 @@ def save_json(contents: dict, file_path: Path) -> None:
     with file_path.open("w") as f:
         json.dump(contents, f, indent=4)
     logger.info("Data has been saved.", file_path=file_path)
+
+
+def iter_csv_chunks(
+    file_path: Path, chunksize: int, usecols: Sequence[str] | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV file as DataFrames of at most `chunksize` rows.
+
+    Only the requested columns are parsed, and every value is kept as a string
+    (empty cells become "") so downstream code never sees NaN floats.
+    """
+    with pd.read_csv(
+        file_path,
+        delimiter=",",
+        usecols=list(usecols) if usecols is not None else None,
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunksize,
+    ) as reader:
+        yield from reader
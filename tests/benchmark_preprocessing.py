@@ -0,0 +1,124 @@
+import re
+import time
+from collections.abc import Callable
+
+import pandas as pd
+import structlog
+
+from flare_ai_rag.data_preprocessing.preprocess import (
+    CLEAN_PATTERNS,
+    chunk_text,
+    clean_text,
+    split_text,
+)
+from flare_ai_rag.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+
+def legacy_split_text(text: str, chunk_size: int = 500) -> list[str]:
+    """The original quadratic splitter, kept as the benchmark baseline."""
+    words = text.split()
+    chunks = []
+    current_chunk = []
+
+    for word in words:
+        if len(" ".join(current_chunk)) + len(word) < chunk_size:
+            current_chunk.append(word)
+        else:
+            chunks.append(" ".join(current_chunk))
+            current_chunk = [word]
+
+    if current_chunk:
+        chunks.append(" ".join(current_chunk))
+
+    return chunks
+
+
+def legacy_clean_text(text: str) -> str:
+    """The original two-pass cleaner, kept as the benchmark baseline."""
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r'[^a-zA-Z0-9.,?!:;()"\s]', "", text)
+    return text.strip()
+
+
+def time_cleaner(
+    name: str,
+    cleaner: Callable[[str], str],
+    texts: list[str],
+    num_bytes: int,
+    repeat: int = 5,
+) -> float:
+    """Return the best throughput of cleaning every text, in MB/s."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            cleaner(text)
+        best = min(best, time.perf_counter() - start)
+    mb_per_second = num_bytes / best / 1e6
+    logger.info("Cleaner timed.", cleaner=name, mb_per_second=mb_per_second)
+    return mb_per_second
+
+
+def time_chunker(
+    name: str, chunker: Callable[[str], list[str]], texts: list[str], repeat: int = 5
+) -> float:
+    """Return the best wall-clock time of chunking every text, in seconds."""
+    best = float("inf")
+    num_chunks = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        num_chunks = sum(len(chunker(text)) for text in texts)
+        best = min(best, time.perf_counter() - start)
+    logger.info("Chunker timed.", chunker=name, seconds=best, chunks=num_chunks)
+    return best
+
+
+def main() -> None:
+    df_docs = pd.read_csv(settings.data_path / "docs.csv", delimiter=",")
+    texts = [text for text in df_docs["content"] if isinstance(text, str)]
+    num_bytes = sum(len(text.encode("utf-8")) for text in texts)
+    logger.info("Loaded corpus.", documents=len(texts), bytes=num_bytes)
+
+    baseline = float("inf")
+    for chunk_size in (500, 4000):
+        legacy = time_chunker(
+            f"legacy_split_text[{chunk_size}]",
+            lambda text, size=chunk_size: legacy_split_text(text, size),
+            texts,
+        )
+        linear = time_chunker(
+            f"split_text[{chunk_size}]",
+            lambda text, size=chunk_size: split_text(text, size),
+            texts,
+        )
+        logger.info("Speedup.", chunk_size=chunk_size, speedup=legacy / linear)
+        baseline = min(baseline, legacy)
+
+    chunked = time_chunker(
+        "chunk_text[256 tokens, 32 overlap]",
+        lambda text: chunk_text(text, max_tokens=256, overlap_tokens=32),
+        texts,
+    )
+    logger.info(
+        "Token-aware chunker throughput.",
+        mb_per_second=num_bytes / chunked / 1e6,
+        relative_to_legacy=baseline / chunked,
+    )
+
+    legacy_clean = time_cleaner(
+        "legacy_clean_text", legacy_clean_text, texts, num_bytes
+    )
+    for profile in CLEAN_PATTERNS:
+        throughput = time_cleaner(
+            f"clean_text[{profile}]",
+            lambda text, profile=profile: clean_text(text, profile),
+            texts,
+            num_bytes,
+        )
+        logger.info("Speedup.", profile=profile, speedup=throughput / legacy_clean)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import statistics
+import time
+import uuid
+from dataclasses import replace
+
+import numpy as np
+import structlog
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import Distance, PointStruct, VectorParams
+
+from flare_ai_rag.retriever import RetrieverConfig, create_qdrant_client
+from flare_ai_rag.settings import settings
+from flare_ai_rag.utils import load_json
+
+logger = structlog.get_logger(__name__)
+
+NUM_POINTS = 10_000
+NUM_QUERIES = 500
+
+
+def fill_collection(
+    client: QdrantClient, collection_name: str, vectors: np.ndarray
+) -> None:
+    """Create a throwaway collection holding the given vectors."""
+    client.recreate_collection(
+        collection_name=collection_name,
+        vectors_config=VectorParams(size=vectors.shape[1], distance=Distance.COSINE),
+    )
+    for start in range(0, len(vectors), 1000):
+        client.upsert(
+            collection_name=collection_name,
+            points=[
+                PointStruct(id=i, vector=vectors[i].tolist(), payload={"n": i})
+                for i in range(start, min(start + 1000, len(vectors)))
+            ],
+        )
+
+
+def time_searches(
+    name: str, client: QdrantClient, collection_name: str, queries: np.ndarray
+) -> None:
+    """Log latency percentiles of one search per query, in milliseconds."""
+    client.search(collection_name, query_vector=queries[0].tolist(), limit=5)  # warm up
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        client.search(collection_name, query_vector=query.tolist(), limit=5)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    logger.info(
+        "Search latency.",
+        transport=name,
+        mean_ms=round(statistics.fmean(latencies), 3),
+        p50_ms=round(latencies[len(latencies) // 2], 3),
+        p95_ms=round(latencies[int(len(latencies) * 0.95)], 3),
+        qps=round(1000 / statistics.fmean(latencies), 1),
+    )
+
+
+def main() -> None:
+    input_config = load_json(settings.input_path / "input_parameters.json")
+    retriever_config = RetrieverConfig.load(input_config["retriever_config"])
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal(
+        (NUM_POINTS, retriever_config.vector_size), dtype=np.float32
+    )
+    queries = rng.standard_normal(
+        (NUM_QUERIES, retriever_config.vector_size), dtype=np.float32
+    )
+    collection_name = f"transport_benchmark_{uuid.uuid4().hex[:8]}"
+
+    # In-process local mode: no transport at all, the lower bound.
+    local_client = QdrantClient(":memory:")
+    fill_collection(local_client, collection_name, vectors)
+    time_searches("local", local_client, collection_name, queries)
+
+    clients = {
+        "rest": create_qdrant_client(replace(retriever_config, prefer_grpc=False)),
+        "grpc": create_qdrant_client(replace(retriever_config, prefer_grpc=True)),
+    }
+    try:
+        fill_collection(clients["grpc"], collection_name, vectors)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(
+            "Qdrant server unreachable, only local mode was measured.",
+            host=retriever_config.host,
+            error=str(e),
+        )
+        return
+
+    try:
+        for name, client in clients.items():
+            time_searches(name, client, collection_name, queries)
+    finally:
+        clients["grpc"].delete_collection(collection_name)
+
+
+if __name__ == "__main__":
+    main()
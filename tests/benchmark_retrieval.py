@@ -0,0 +1,255 @@
+import json
+import re
+import statistics
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import structlog
+from qdrant_client import QdrantClient
+
+from flare_ai_rag.ai import EmbeddingCache, GeminiEmbedding
+from flare_ai_rag.retriever import (
+    BaseRetriever,
+    BM25Index,
+    NumpyRetriever,
+    NumpyVectorIndex,
+    QdrantRetriever,
+    QueryVectorCache,
+    RetrieverConfig,
+    bm25_index_path,
+    create_qdrant_client,
+    generate_collection,
+    vector_index_path,
+)
+from flare_ai_rag.settings import settings
+from flare_ai_rag.utils import load_json
+
+logger = structlog.get_logger(__name__)
+
+REPORT_PATH = Path("retrieval_benchmark.json")
+RECALL_AT = (1, 3, 5, 10)
+# Headings such as "Functions" or "Parameters" appear in most reference pages and
+# say nothing about retrieval quality.
+MAX_RELEVANT_FILES = 3
+
+TITLE_PATTERN = re.compile(r"^title:\s*(.+?)\s*$", re.MULTILINE)
+HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$", re.MULTILINE)
+
+# Storage variants change how the collection is built, so each gets its own
+# collection; search variants only change query-time parameters.
+STORAGE_VARIANTS: dict[str, dict[str, Any]] = {
+    "float32": {"quantization": "none"},
+    "scalar": {"quantization": "scalar"},
+    "binary": {"quantization": "binary"},
+}
+# The NumPy backend is exported from this storage variant's collection.
+NUMPY_SOURCE = "float32"
+# Every search variant starts from this baseline, so runs differ in one knob only.
+SEARCH_BASELINE: dict[str, Any] = {
+    "retrieval_mode": "dense",
+    "hnsw_ef": None,
+    "rescore": True,
+    "mmr_diversity": 0.0,
+    "score_threshold": None,
+    "adaptive_top_k": False,
+}
+SEARCH_VARIANTS: dict[str, dict[str, Any]] = {
+    "dense": {},
+    "dense_ef16": {"hnsw_ef": 16},
+    "dense_ef256": {"hnsw_ef": 256},
+    "dense_no_rescore": {"rescore": False},
+    "dense_mmr": {"mmr_diversity": 0.3},
+    "dense_adaptive": {"score_threshold": 0.3, "adaptive_top_k": True},
+    "hybrid": {"retrieval_mode": "hybrid"},
+    "hybrid_mmr": {"retrieval_mode": "hybrid", "mmr_diversity": 0.3},
+    "hybrid_adaptive": {"retrieval_mode": "hybrid", "adaptive_top_k": True},
+}
+
+
+def labeled_queries(df_docs: pd.DataFrame) -> dict[str, set[str]]:
+    """
+    Build a labeled query set from the docs: every page title and section heading
+    is a query whose relevant results are the files it appears in.
+    """
+    relevant: dict[str, set[str]] = {}
+    for file_name, meta_data, content in zip(
+        df_docs["file_name"], df_docs["meta_data"], df_docs["content"], strict=True
+    ):
+        headings = TITLE_PATTERN.findall(str(meta_data)) + HEADING_PATTERN.findall(
+            str(content)
+        )
+        for heading in headings:
+            relevant.setdefault(heading, set()).add(file_name)
+    return {
+        query: files
+        for query, files in relevant.items()
+        if len(files) <= MAX_RELEVANT_FILES
+    }
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def evaluate(
+    retriever: BaseRetriever, queries: dict[str, set[str]], top_k: int
+) -> dict[str, Any]:
+    """
+    Search every query once and report recall@k, MRR, the mean number of returned
+    documents and latency percentiles.
+    """
+    hits_at = dict.fromkeys(RECALL_AT, 0)
+    reciprocal_ranks = []
+    latencies = []
+    returned = []
+    for query, files in queries.items():
+        start = time.perf_counter()
+        documents = retriever.semantic_search(query, top_k=top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        returned.append(len(documents))
+
+        rank = next(
+            (
+                position
+                for position, document in enumerate(documents, start=1)
+                if document["source"] in files
+            ),
+            None,
+        )
+        reciprocal_ranks.append(1 / rank if rank else 0.0)
+        for k in RECALL_AT:
+            hits_at[k] += rank is not None and rank <= k
+
+    latencies.sort()
+    return {
+        "queries": len(queries),
+        "top_k": top_k,
+        **{f"recall@{k}": hits / len(queries) for k, hits in hits_at.items()},
+        "mrr": statistics.fmean(reciprocal_ranks),
+        "mean_documents": statistics.fmean(returned),
+        "p50_ms": percentile(latencies, 0.5),
+        "p99_ms": percentile(latencies, 0.99),
+        "mean_ms": statistics.fmean(latencies),
+    }
+
+
+def connect(retriever_config: RetrieverConfig) -> tuple[QdrantClient, str]:
+    """Connect to the configured Qdrant server, falling back to local mode."""
+    client = create_qdrant_client(retriever_config)
+    try:
+        client.get_collections()
+    except Exception as e:  # noqa: BLE001
+        logger.warning(
+            "Qdrant server unreachable, benchmarking local mode, which ignores "
+            "HNSW and quantization settings.",
+            host=retriever_config.host,
+            error=str(e),
+        )
+        return QdrantClient(":memory:"), "local"
+    return client, "server"
+
+
+def main() -> None:
+    input_config = load_json(settings.input_path / "input_parameters.json")
+    base_config = RetrieverConfig.load(input_config["retriever_config"])
+    df_docs = pd.read_csv(settings.data_path / "docs.csv", delimiter=",")
+    queries = labeled_queries(df_docs)
+    top_k = max(RECALL_AT)
+    logger.info("Labeled query set built.", queries=len(queries))
+
+    qdrant_client, backend = connect(base_config)
+    if backend == "local":
+        # Local mode is not thread-safe.
+        base_config = replace(base_config, upsert_parallelism=1)
+    embedding_client = GeminiEmbedding(
+        settings.gemini_api_key,
+        cache=EmbeddingCache(
+            settings.embedding_cache_path,
+            vector_size=base_config.vector_size,
+            max_entries=base_config.embedding_cache_max_entries,
+        ),
+    )
+    # Every query is embedded once up front, so the timings measure search only.
+    query_cache = QueryVectorCache(max_entries=len(queries), ttl_seconds=float("inf"))
+
+    warmup = QdrantRetriever(qdrant_client, base_config, embedding_client, query_cache)
+    warmup.embed_queries(list(queries))
+
+    runs = []
+    for storage_name, storage in STORAGE_VARIANTS.items():
+        collection_config = replace(
+            base_config,
+            collection_name=f"{base_config.collection_name}_benchmark_{storage_name}",
+            sync_mode="incremental",
+            **storage,
+        )
+        generate_collection(df_docs, qdrant_client, collection_config, embedding_client)
+        bm25_path = bm25_index_path(collection_config.collection_name)
+        bm25_index = BM25Index.load(bm25_path) if bm25_path.exists() else None
+
+        numpy_index = None
+        if storage_name == NUMPY_SOURCE:
+            numpy_index = NumpyVectorIndex.from_qdrant(
+                qdrant_client,
+                collection_config.collection_name,
+                vector_index_path(collection_config.collection_name),
+            )
+
+        for search_name, variant in SEARCH_VARIANTS.items():
+            search = {**SEARCH_BASELINE, **variant}
+            retriever_config = replace(collection_config, **search)
+            retrievers: dict[str, BaseRetriever] = {
+                storage_name: QdrantRetriever(
+                    qdrant_client,
+                    retriever_config,
+                    embedding_client,
+                    query_cache=query_cache,
+                    bm25_index=bm25_index,
+                )
+            }
+            # The in-process index is dense-only.
+            if numpy_index is not None and search["retrieval_mode"] == "dense":
+                retrievers["numpy"] = NumpyRetriever(
+                    numpy_index,
+                    replace(retriever_config, backend="numpy"),
+                    embedding_client,
+                    query_cache=query_cache,
+                )
+            for backend_name, retriever in retrievers.items():
+                metrics = evaluate(retriever, queries, top_k)
+                logger.info(
+                    "Configuration evaluated.",
+                    storage=backend_name,
+                    search=search_name,
+                    **metrics,
+                )
+                runs.append(
+                    {
+                        "storage": backend_name,
+                        "search": search_name,
+                        "config": {**storage, **search},
+                        **metrics,
+                    }
+                )
+
+    report = {
+        "backend": backend,
+        "collection_points": {
+            name: qdrant_client.count(
+                f"{base_config.collection_name}_benchmark_{name}"
+            ).count
+            for name in STORAGE_VARIANTS
+        },
+        "runs": runs,
+    }
+    REPORT_PATH.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    logger.info("Benchmark report written.", path=str(REPORT_PATH.resolve()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+from flare_ai_rag.ai import EmbeddingCache
+
+VECTOR_SIZE = 4
+MAX_ENTRIES = 2
+
+
+def vector(value: float) -> list[float]:
+    return [value] * VECTOR_SIZE
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path, VECTOR_SIZE, max_entries=MAX_ENTRIES)
+    cache.put("a", vector(1.0))
+    cache.put("b", vector(2.0))
+    assert cache.get("a") == vector(1.0)  # "b" is now the least recently used
+
+    cache.put("c", vector(3.0))
+
+    assert len(cache) == MAX_ENTRIES
+    assert cache.get("b") is None
+    assert cache.get("a") == vector(1.0)
+    assert cache.get("c") == vector(3.0)
+
+
+def test_reload_drops_entries_whose_slot_was_reused(tmp_path: Path) -> None:
+    cache = EmbeddingCache(
+        tmp_path, VECTOR_SIZE, max_entries=MAX_ENTRIES, flush_every=1000
+    )
+    cache.put("a", vector(1.0))
+    cache.put("b", vector(2.0))
+    cache.flush()
+    # Evicts "a" and overwrites its slot, but the index on disk is not rewritten.
+    cache.put("c", vector(3.0))
+    del cache
+
+    reloaded = EmbeddingCache(tmp_path, VECTOR_SIZE, max_entries=MAX_ENTRIES)
+
+    assert reloaded.get("a") is None
+    assert reloaded.get("b") == vector(2.0)
+    assert reloaded.get("c") is None
+    assert len(reloaded) == 1
+
+
+def test_reload_with_fewer_max_entries(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path, VECTOR_SIZE, max_entries=2 * MAX_ENTRIES)
+    for idx, key in enumerate("abcd"):
+        cache.put(key, vector(float(idx)))
+    cache.flush()
+    del cache
+
+    reloaded = EmbeddingCache(tmp_path, VECTOR_SIZE, max_entries=MAX_ENTRIES)
+
+    assert len(reloaded) == MAX_ENTRIES
+    assert reloaded.get_many(list("abcd")) == [vector(0.0), vector(1.0), None, None]
+    reloaded.put("e", vector(4.0))
+    assert len(reloaded) == MAX_ENTRIES
+    assert reloaded.get("e") == vector(4.0)
+    assert reloaded.get("a") is None  # least recently used
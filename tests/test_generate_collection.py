@@ -1,4 +1,3 @@
-import pandas as pd
 import structlog
 from qdrant_client import QdrantClient
 
@@ -6,7 +5,7 @@ from flare_ai_rag.ai import GeminiEmbedding
 from flare_ai_rag.retriever.config import RetrieverConfig
 from flare_ai_rag.retriever.qdrant_collection import generate_collection
 from flare_ai_rag.settings import settings
-from flare_ai_rag.utils import load_json
+from flare_ai_rag.utils import iter_csv_chunks, load_json
 
 logger = structlog.get_logger(__name__)
 
@@ -16,9 +15,12 @@ def main() -> None:
     config_json = load_json(settings.input_path / "input_parameters.json")
     retriever_config = RetrieverConfig.load(config_json["retriever_config"])
 
-    # Load the CSV file.
-    df_docs = pd.read_csv(settings.data_path / "docs.csv", delimiter=",")
-    logger.info("Loaded CSV Data.", num_rows=len(df_docs))
+    # Stream the CSV file in chunks.
+    df_docs = iter_csv_chunks(
+        settings.data_path / "docs.csv",
+        chunksize=retriever_config.csv_chunk_size,
+        usecols=["file_name", "meta_data", "content"],
+    )
 
     # Initialize Qdrant client.
     client = QdrantClient(host=retriever_config.host, port=retriever_config.port)